@@ -1,3 +1,5 @@
+# These earlier solutions shadow each other under one class name; runnable,
+# benchmarked versions of all of them live in solutions.py
 # class Solution(object):
 #     def fizzBuzz(self, n):
 #         res = []
@@ -115,6 +117,12 @@ class Solution(object):
 
         return new
 
+    def addDigitsO1(self, num):
+        # Digital root: num is congruent to its digit sum mod 9
+        if num == 0:
+            return 0
+        return 1 + (num - 1) % 9
+
 if __name__ == "__main__":
     sol = Solution()
     res = sol.addDigits(38)
@@ -0,0 +1,116 @@
+# Linear-time anagram checks and bulk anagram grouping
+#
+#   is_anagram(s, t)           O(n) letter counting instead of two sorts
+#   group_anagrams(words)      anagram classes keyed by letter-count signatures
+#   group_anagrams_file(path)  the same, streaming a word list in batches
+#
+#   python anagrams.py WORDLIST [OUTPUT] [--min-size K]
+import argparse
+import sys
+import time
+from collections import Counter, defaultdict
+from itertools import islice
+
+import numpy as np
+
+A = ord("a")
+# Above this length a NumPy bincount beats counting in Python
+BINCOUNT_MIN_LENGTH = 256
+# Longer words are grouped by sorted characters instead of the count matrix
+MAX_WORD_LENGTH = 64
+
+
+def is_anagram(s, t):
+    if len(s) != len(t):
+        return False
+    if s.isascii() and t.isascii():
+        if len(s) >= BINCOUNT_MIN_LENGTH:
+            a = np.frombuffer(s.encode("ascii"), dtype=np.uint8)
+            b = np.frombuffer(t.encode("ascii"), dtype=np.uint8)
+            return np.array_equal(np.bincount(a, minlength=128), np.bincount(b, minlength=128))
+        if s.islower() and t.islower() and s.isalpha() and t.isalpha():
+            counts = [0] * 26
+            for ch in s.encode("ascii"):
+                counts[ch - A] += 1
+            for ch in t.encode("ascii"):
+                counts[ch - A] -= 1
+            return not any(counts)
+    return Counter(s) == Counter(t)
+
+
+def _signatures(words):
+    """Letter-count signature of every word in one vectorized pass.
+
+    Words are lowercased; anything that is not plain a-z falls back to its
+    sorted characters (as a str), which is still a valid anagram key.
+    """
+    encoded = [w.lower().encode("utf-8") for w in words]
+    # Overlong lines would blow up the padded matrix; they take the fallback
+    too_long = np.fromiter((len(e) > MAX_WORD_LENGTH for e in encoded), dtype=bool, count=len(encoded))
+    if too_long.any():
+        encoded = [b"" if long else e for e, long in zip(encoded, too_long.tolist())]
+    width = max(max(map(len, encoded), default=0), 1)
+
+    chars = np.frombuffer(b"".join(e.ljust(width, b"\0") for e in encoded), dtype=np.uint8).reshape(-1, width)
+    letters = (chars >= A) & (chars < A + 26)
+    plain = (letters | (chars == 0)).all(axis=1) & ~too_long
+
+    rows = np.nonzero(letters)[0]
+    index = rows * 26 + (chars[letters] - A)
+    counts = np.bincount(index, minlength=len(words) * 26).astype(np.uint16).reshape(-1, 26)
+    keys = counts.view("S52").ravel().tolist()
+
+    # str keys can never collide with the bytes count signatures
+    for i in np.flatnonzero(~plain).tolist():
+        keys[i] = "".join(sorted(words[i].lower()))
+    return keys
+
+
+def group_anagrams(words, groups=None):
+    """Add words to a signature -> [words] mapping and return it."""
+    if groups is None:
+        groups = defaultdict(list)
+    for key, word in zip(_signatures(words), words):
+        groups[key].append(word)
+    return groups
+
+
+def group_anagrams_file(path, batch_size=100_000):
+    groups = defaultdict(list)
+    with open(path, encoding="utf-8") as f:
+        stripped = (line.strip() for line in f)
+        words = (w for w in stripped if w)
+        while True:
+            batch = list(islice(words, batch_size))
+            if not batch:
+                break
+            group_anagrams(batch, groups)
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Group a word list into anagram classes.")
+    parser.add_argument("wordlist")
+    parser.add_argument("output", nargs="?", help="defaults to stdout")
+    parser.add_argument("--min-size", type=int, default=2, help="smallest class to print")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    groups = group_anagrams_file(args.wordlist)
+    elapsed = time.perf_counter() - start
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for members in groups.values():
+            if len(members) >= args.min_size:
+                out.write(" ".join(members) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    words = sum(map(len, groups.values()))
+    print(f"{words} words, {len(groups)} classes in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
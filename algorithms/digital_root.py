@@ -0,0 +1,94 @@
+# Digital roots in bulk
+#
+#   digital_root_batch    whole NumPy integer arrays, vectorized
+#   digital_root_stream   numbers given as very long digit strings or
+#                         files, summed over bytes without building ints
+#
+#   python digital_root.py    benchmarks against Solution.addDigits
+import io
+import sys
+import time
+
+import numpy as np
+
+from Solution import Solution
+
+DIGITS = [str(d).encode() for d in range(1, 10)]
+
+
+def digital_root_batch(nums):
+    """Digital root of every non-negative integer in nums, as an array."""
+    nums = np.asarray(nums)
+    if nums.size and nums.min() < 0:
+        raise ValueError("Digital roots are defined for non-negative integers.")
+    return np.where(nums == 0, 0, 1 + (nums - 1) % 9)
+
+
+def digital_root_stream(source, chunk_size=1 << 20):
+    """Digital root of a number written out in decimal.
+
+    source is a str, bytes, or a binary file object; non-digit bytes such
+    as newlines are ignored. Each chunk is reduced with nine bytes.count
+    calls, so millions of digits never become a Python int.
+    """
+    if isinstance(source, str):
+        source = source.encode()
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+
+    total = 0
+    for chunk in iter(lambda: source.read(chunk_size), b""):
+        for value, digit in enumerate(DIGITS, start=1):
+            total += value * chunk.count(digit)
+    if total == 0:
+        return 0
+    return 1 + (total - 1) % 9
+
+
+def benchmark(n=10**6, digits=10**7, seed=0):
+    sol = Solution()
+    rng = np.random.default_rng(seed)
+    nums = rng.integers(0, 2**62, size=n, dtype=np.int64)
+    sample = nums[:100_000].tolist()
+
+    start = time.perf_counter()
+    loop = [sol.addDigits(x) for x in sample]
+    loop_time = (time.perf_counter() - start) * n / len(sample)
+
+    start = time.perf_counter()
+    o1 = [sol.addDigitsO1(x) for x in sample]
+    o1_time = (time.perf_counter() - start) * n / len(sample)
+
+    start = time.perf_counter()
+    batch = digital_root_batch(nums)
+    batch_time = time.perf_counter() - start
+    assert loop == o1 == batch[:len(sample)].tolist()
+
+    print(f"{n} numbers below 2^62 (loop versions extrapolated from {len(sample)})")
+    print(f"  addDigits loop        {loop_time * 1000:>10.1f}ms")
+    print(f"  addDigitsO1           {o1_time * 1000:>10.1f}ms")
+    print(f"  digital_root_batch    {batch_time * 1000:>10.1f}ms")
+
+    text = rng.integers(0, 10, size=digits, dtype=np.uint8) + ord("0")
+    text = text.tobytes()
+    # int() refuses very long strings by default; lift the limit for the baseline
+    if hasattr(sys, "set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+
+    start = time.perf_counter()
+    stream = digital_root_stream(text)
+    stream_time = time.perf_counter() - start
+
+    small = text[:100_000]
+    start = time.perf_counter()
+    expected = sol.addDigits(int(small))
+    loop_small = time.perf_counter() - start
+    assert expected == digital_root_stream(small)
+
+    print(f"{digits} digit number")
+    print(f"  addDigits loop        {loop_small * 1000:>10.1f}ms for only {len(small)} digits")
+    print(f"  digital_root_stream   {stream_time * 1000:>10.1f}ms  (root {stream})")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,178 @@
+# Streaming FizzBuzz for very large n
+#
+# FizzBuzz.fizzBuzz builds a list of n strings, which cannot work for
+# n = 10^9. Here output is produced in bounded-size chunks instead:
+#
+#   fizz_buzz_iter(n)      lazy generator of the same strings
+#   fizz_buzz_chunks(n)    bytes chunks of the newline-separated output
+#   write_fizz_buzz(n, f)  writes the chunks straight to a binary stream
+#
+# Within a run of numbers with the same digit count, every 15-number
+# cycle has the same byte layout. A chunk is that cycle template tiled
+# with NumPy, with only the digits of the 8 plain numbers per cycle
+# filled in, vectorized.
+#
+# From five digits up, most of the output comes in blocks of BLOCK
+# numbers starting at 1 (mod BLOCK). Those blocks all have the same
+# labels and the same low four digits, so each width has one cached
+# block template. A block only has to write its higher digits, which take
+# four values per block, into the template.
+#
+#   python fizzbuzz_stream.py N > out.txt    (throughput goes to stderr)
+import sys
+import time
+
+import numpy as np
+
+
+def _label(i):
+    if i % 15 == 0:
+        return "FizzBuzz"
+    if i % 5 == 0:
+        return "Buzz"
+    if i % 3 == 0:
+        return "Fizz"
+    return None
+
+
+def fizz_buzz_iter(n):
+    for i in range(1, n + 1):
+        yield _label(i) or str(i)
+
+
+_templates = {}
+
+
+def _cycle_template(width):
+    """Byte layout of one cycle starting at a number = 1 (mod 15)."""
+    if width not in _templates:
+        template = bytearray()
+        slots = []
+        for offset in range(15):
+            label = _label(offset + 1)
+            if label:
+                template += label.encode()
+            else:
+                slots.append(len(template))
+                template += b"0" * width
+            template += b"\n"
+        _templates[width] = (np.frombuffer(bytes(template), dtype=np.uint8), np.array(slots),
+                             np.array([o for o in range(15) if not _label(o + 1)]))
+    return _templates[width]
+
+
+# 15 * 2000, and a multiple of 10^4, so every block has the same layout
+BLOCK = 30000
+_blocks = {}
+
+
+def _block_template(width):
+    """(bytes of a block, high-digit positions per value of number // 10^4 - base)."""
+    if width not in _blocks:
+        template, slots, offsets = _cycle_template(width)
+        # Any block of this width gives the labels and low four digits
+        first = 10 ** (width - 1)
+        start = first + (1 - first) % BLOCK
+        block = np.frombuffer(_fast_chunk(start, BLOCK // 15, width), dtype=np.uint8).copy()
+        cycle = np.arange(BLOCK // 15)[:, None]
+        # Byte offset of every plain number, and its j // 10^4 for j = 1..BLOCK
+        where = (cycle * len(template) + slots[None, :]).ravel()
+        which = ((15 * cycle + offsets[None, :] + 1) // 10000).ravel()
+        digits = np.arange(width - 4)
+        high = [(where[which == k][:, None] + digits[None, :]) for k in range(4)]
+        _blocks[width] = (block, high)
+    return _blocks[width]
+
+
+def _block_chunk(start, width):
+    block, high = _block_template(width)
+    out = block.copy()
+    base = (start - 1) // 10000
+    for k, positions in enumerate(high):
+        if len(positions):
+            out[positions] = np.frombuffer(f"{base + k:0{width - 4}d}".encode(), dtype=np.uint8)
+    return out.data
+
+
+def _cycle_chunks(start, cycles, width, cycles_per_chunk):
+    while cycles:
+        n = min(cycles, cycles_per_chunk)
+        yield _fast_chunk(start, n, width)
+        start += 15 * n
+        cycles -= n
+
+
+def _slow_chunk(start, stop):
+    return "".join((_label(i) or str(i)) + "\n" for i in range(start, stop + 1)).encode()
+
+
+# ASCII digits of 0000..9999, so numbers are converted four digits at a time
+DIGIT_GROUPS = np.array([list(f"{i:04d}".encode()) for i in range(10000)], dtype=np.uint8)
+
+
+def _fast_chunk(start, cycles, width):
+    template, slots, offsets = _cycle_template(width)
+    buf = np.tile(template, (cycles, 1))
+    nums = start + 15 * np.arange(cycles, dtype=np.int64)[:, None] + offsets[None, :]
+
+    groups = -(-width // 4)
+    digits = np.empty((cycles, len(offsets), 4 * groups), dtype=np.uint8)
+    for g in range(groups):
+        digits[:, :, 4 * (groups - g - 1):4 * (groups - g)] = DIGIT_GROUPS[nums % 10000]
+        nums //= 10000
+    # Copy each number column into its slot, dropping the top group's zero padding
+    pad = 4 * groups - width
+    for k, slot in enumerate(slots):
+        buf[:, slot:slot + width] = digits[:, k, pad:]
+    return buf.reshape(-1).data
+
+
+def fizz_buzz_chunks(n, cycles_per_chunk=1 << 13):
+    """Yield the output for 1..n as bytes-like chunks of bounded size."""
+    i = 1
+    while i <= n:
+        width = len(str(i))
+        last = min(n, 10 ** width - 1)
+
+        # Numbers before the first cycle boundary (= 1 mod 15) go the slow way
+        head_end = min(last, i + (1 - i) % 15 - 1)
+        if head_end >= i:
+            yield _slow_chunk(i, head_end)
+            i = head_end + 1
+
+        end = i + 15 * ((last - i + 1) // 15)  # just past the whole cycles
+        if width > 4:
+            # Cycles up to the first block boundary, then whole blocks
+            first_block = i + (1 - i) % BLOCK
+            blocks = max(0, (end - first_block) // BLOCK)
+            if blocks:
+                yield from _cycle_chunks(i, (first_block - i) // 15, width, cycles_per_chunk)
+                for b in range(blocks):
+                    yield _block_chunk(first_block + b * BLOCK, width)
+                i = first_block + blocks * BLOCK
+        yield from _cycle_chunks(i, (end - i) // 15, width, cycles_per_chunk)
+        i = end
+
+        if i <= last:
+            yield _slow_chunk(i, last)
+            i = last + 1
+
+
+def write_fizz_buzz(n, stream=None):
+    """Write the output for 1..n to a binary stream; returns bytes written."""
+    if stream is None:
+        stream = sys.stdout.buffer
+    written = 0
+    for chunk in fizz_buzz_chunks(n):
+        stream.write(chunk)
+        written += len(chunk)
+    return written
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10**8
+    start = time.perf_counter()
+    size = write_fizz_buzz(n)
+    sys.stdout.flush()
+    elapsed = time.perf_counter() - start
+    print(f"{size / 2**20:.0f} MB in {elapsed:.2f}s ({size / 2**20 / elapsed:.0f} MB/s)", file=sys.stderr)
@@ -0,0 +1,168 @@
+# Compact linked lists for the deleteDuplicates family
+#
+#   ListNode            the LeetCode node, with __slots__ (no per-node __dict__)
+#   ArrayList           values and next indexes in two parallel array('i')
+#                       buffers, 8 bytes per node; -1 ends the list
+#   build_list / list_values        Python sequence <-> ListNode chain
+#   ArrayList.from_values / values  Python sequence <-> ArrayList
+#   delete_duplicates(lst)          dedup a sorted list of either kind in place
+#
+#   python linked_list.py [N]    memory per node and dedup throughput (default 10^7)
+import sys
+import time
+import tracemalloc
+from array import array
+
+import numpy as np
+
+NIL = -1
+
+
+class ListNode(object):
+    __slots__ = ("val", "next")
+
+    def __init__(self, val=0, next=None):
+        self.val = val
+        self.next = next
+
+
+def build_list(values):
+    head = None
+    for v in reversed(values):
+        head = ListNode(v, head)
+    return head
+
+
+def list_values(head):
+    values = []
+    while head:
+        values.append(head.val)
+        head = head.next
+    return values
+
+
+class ArrayList(object):
+    def __init__(self, vals, nexts, head):
+        self.vals = vals
+        self.nexts = nexts
+        self.head = head
+
+    @classmethod
+    def from_values(cls, values):
+        vals = array("i", values)
+        n = len(vals)
+        nexts = array("i")
+        nexts.frombytes(np.arange(1, n + 1, dtype=np.int32).tobytes())
+        if n:
+            nexts[-1] = NIL
+        return cls(vals, nexts, 0 if n else NIL)
+
+    def values(self):
+        vals, nexts = self.vals, self.nexts
+        out = []
+        i = self.head
+        while i != NIL:
+            out.append(vals[i])
+            i = nexts[i]
+        return out
+
+    def is_sequential(self):
+        """True if node i links to node i + 1 for the whole buffer."""
+        n = len(self.vals)
+        if self.head != (0 if n else NIL):
+            return False
+        nexts = np.frombuffer(self.nexts, dtype=np.int32)
+        return n == 0 or (nexts[-1] == NIL and bool((nexts[:-1] == np.arange(1, n)).all()))
+
+
+def _delete_duplicates_nodes(head):
+    current = head
+    while current and current.next:
+        if current.val == current.next.val:
+            current.next = current.next.next
+        else:
+            current = current.next
+    return head
+
+
+def _delete_duplicates_array(lst):
+    if not len(lst.vals):
+        return lst
+    if lst.is_sequential():
+        # Freshly built lists are laid out in order: relink every kept node
+        # to the next kept one in one vectorized pass
+        vals = np.frombuffer(lst.vals, dtype=np.int32)
+        nexts = np.frombuffer(lst.nexts, dtype=np.int32)
+        keep = np.flatnonzero(np.concatenate(([True], vals[1:] != vals[:-1])))
+        nexts[keep[:-1]] = keep[1:]
+        nexts[keep[-1]] = NIL
+        return lst
+    return _delete_duplicates_links(lst)
+
+
+def _delete_duplicates_links(lst):
+    vals, nexts = lst.vals, lst.nexts
+    i = lst.head
+    while i != NIL:
+        j = nexts[i]
+        while j != NIL and vals[j] == vals[i]:
+            j = nexts[j]
+        nexts[i] = j
+        i = j
+    return lst
+
+
+def delete_duplicates(lst):
+    """Remove repeated values from a sorted ListNode chain or ArrayList."""
+    if isinstance(lst, ArrayList):
+        return _delete_duplicates_array(lst)
+    return _delete_duplicates_nodes(lst)
+
+
+def _measure(build):
+    """(seconds, bytes, result) for build(); timed and traced in separate runs."""
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return elapsed, size, result
+
+
+def benchmark(n=10**7):
+    values = (np.arange(n, dtype=np.int64) // 3).tolist()
+    expected = n // 3 + (n % 3 > 0)
+
+    rows = []
+    build_time, size, head = _measure(lambda: build_list(values))
+    start = time.perf_counter()
+    delete_duplicates(head)
+    rows.append(("ListNode", build_time, size, time.perf_counter() - start))
+    assert len(list_values(head)) == expected
+    del head
+
+    build_time, size, lst = _measure(lambda: ArrayList.from_values(values))
+    start = time.perf_counter()
+    delete_duplicates(lst)
+    rows.append(("ArrayList (vectorized)", build_time, size, time.perf_counter() - start))
+    assert len(lst.values()) == expected
+
+    # The pointer-chasing pass, as used for lists that were relinked
+    lst = ArrayList.from_values(values)
+    start = time.perf_counter()
+    _delete_duplicates_links(lst)
+    rows.append(("ArrayList (links)", build_time, size, time.perf_counter() - start))
+    assert len(lst.values()) == expected
+    del lst
+
+    print(f"{n} nodes")
+    print(f"{'representation':<24} {'build':>9} {'bytes/node':>11} {'dedup':>9} {'Mnodes/s':>9}")
+    for name, build_time, size, dedup in rows:
+        print(f"{name:<24} {build_time:>8.2f}s {size / n:>11.1f} {dedup:>8.2f}s {n / dedup / 1e6:>9.1f}")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10**7)
@@ -0,0 +1,103 @@
+# Palindrome checks for huge strings and files, without copies
+#
+# ValidPalindrome.isPalindrome builds a filtered copy and then a lowercased
+# copy of the whole input before comparing. These versions work directly
+# on bytes, memoryviews or memory-mapped files instead (ASCII semantics:
+# letters and digits count, case is ignored, every other byte is skipped):
+#
+#   is_palindrome_buffer(buf)   two pointers over the buffer in place, O(1) memory
+#   is_palindrome_blocks(buf)   NumPy: filters one block from each end at a time
+#                               and compares them vectorized, O(block) memory
+#   is_palindrome_file(path)    memory-maps a file and runs one of the above
+#
+#   python palindrome.py FILE
+import mmap
+import sys
+import time
+
+import numpy as np
+
+# 256-entry lookup tables: which bytes count, and their lowercase form
+ALNUM = bytes(1 if chr(b).isascii() and chr(b).isalnum() else 0 for b in range(256))
+LOWER = bytes(range(256)).lower()
+ALNUM_MASK = np.frombuffer(ALNUM, dtype=np.uint8).astype(bool)
+LOWER_TABLE = np.frombuffer(LOWER, dtype=np.uint8)
+
+
+def is_palindrome_buffer(buf):
+    view = memoryview(buf).cast("B")
+    alnum, lower = ALNUM, LOWER
+    left, right = 0, len(view) - 1
+    while left < right:
+        if not alnum[view[left]]:
+            left += 1
+        elif not alnum[view[right]]:
+            right -= 1
+        elif lower[view[left]] != lower[view[right]]:
+            return False
+        else:
+            left += 1
+            right -= 1
+    return True
+
+
+def _filtered(data, start, stop, reverse):
+    """Lowercased alnum bytes of data[start:stop] with their raw positions."""
+    block = data[start:stop]
+    positions = np.flatnonzero(ALNUM_MASK[block])
+    if reverse:
+        positions = positions[::-1]
+    return LOWER_TABLE[block[positions]], positions + start
+
+
+def is_palindrome_blocks(buf, block_size=1 << 20):
+    data = np.frombuffer(buf, dtype=np.uint8)
+    front_raw, back_raw = 0, len(data)
+    front = back = (np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.int64))
+
+    while True:
+        # Each end may read past the other's raw position; the crossing test
+        # below is what decides where the comparison stops
+        if not len(front[0]):
+            if front_raw >= len(data):
+                return True
+            front = _filtered(data, front_raw, front_raw + block_size, False)
+            front_raw += block_size
+            continue
+        if not len(back[0]):
+            if back_raw <= 0:
+                return True
+            back = _filtered(data, max(back_raw - block_size, 0), back_raw, True)
+            back_raw = max(back_raw - block_size, 0)
+            continue
+
+        k = min(len(front[0]), len(back[0]))
+        # Stop where the two ends meet: front positions rise, back ones fall
+        crossed = front[1][:k] >= back[1][:k]
+        if crossed.any():
+            k = int(np.argmax(crossed))
+            return bool(np.array_equal(front[0][:k], back[0][:k]))
+        if not np.array_equal(front[0][:k], back[0][:k]):
+            return False
+        front = (front[0][k:], front[1][k:])
+        back = (back[0][k:], back[1][k:])
+
+
+def is_palindrome_file(path, vectorized=True):
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return True  # empty file
+        try:
+            return is_palindrome_blocks(mm) if vectorized else is_palindrome_buffer(mm)
+        finally:
+            mm.close()
+
+
+if __name__ == "__main__":
+    path = sys.argv[1]
+    start = time.perf_counter()
+    result = is_palindrome_file(path)
+    elapsed = time.perf_counter() - start
+    print(f"{result} ({elapsed:.2f}s)")
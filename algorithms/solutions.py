@@ -0,0 +1,309 @@
+# Registry of the earlier LeetCode solutions from Solution.py
+#
+# The commented-out classes in Solution.py all shared the name Solution and
+# shadowed each other. Here each one gets its own class holding the
+# original approach next to an optimized one (where one actually wins in
+# CPython), plus a batch entry point (lists or NumPy arrays in, arrays
+# out). SOLUTIONS maps the LeetCode method name to all three.
+#
+#   python solutions.py [name ...]    benchmark original vs optimized vs batch
+import random
+import sys
+import time
+from collections import Counter, namedtuple
+
+import numpy as np
+
+from linked_list import ListNode, build_list, list_values  # noqa: F401
+from vowel_strings import VowelStringsIndex
+
+VOWELS = frozenset("aeiou")
+INT_MIN, INT_MAX = -2**31, 2**31 - 1
+
+
+class FizzBuzz(object):
+    def fizzBuzz(self, n):
+        res = []
+        for i in range(1, n + 1):
+            if i % 15 == 0:
+                res.append("FizzBuzz")
+            elif i % 5 == 0:
+                res.append("Buzz")
+            elif i % 3 == 0:
+                res.append("Fizz")
+            else:
+                res.append(str(i))
+
+        return res
+
+    def fizzBuzzFast(self, n):
+        # The pattern repeats every 15 numbers; only the plain numbers change
+        cycle = [None, None, "Fizz", None, "Buzz", "Fizz", None, None, "Fizz", "Buzz",
+                 None, "Fizz", None, None, "FizzBuzz"]
+        return [cycle[(i - 1) % 15] or str(i) for i in range(1, n + 1)]
+
+
+class PalindromeNumber(object):
+    def isPalindrome(self, x):
+        s = str(x)
+        rev = s[::-1]
+
+        if s == rev:
+            return True
+        else:
+            return False
+
+    # No separate fast version: reversing the digits arithmetically is
+    # slower in CPython than the C-level str slice used here
+
+
+class ReverseInteger(object):
+    def reverse(self, x):
+        if x < 0:
+            s = str(x)[1:]
+            rev = s[::-1]
+            res = int(rev) * -1
+        else:
+            res = int(str(x)[::-1])
+
+        if res < -2**31 or res > 2**31 - 1:
+            return 0
+
+        return res
+
+    # As with PalindromeNumber, the str slice beats digit arithmetic in
+    # CPython; only the batch version does the arithmetic, vectorized
+
+
+class VowelStrings(object):
+    def vowelStrings(self, words, left, right):
+        vowels = ["a", "e", "i", "o", "u"]
+        count = 0
+
+        for i in range(left, right + 1):
+            if words[i][0] in vowels and words[i][-1] in vowels:
+                count += 1
+
+        return count
+
+    def vowelStringsFast(self, words, left, right):
+        return sum(1 for w in words[left:right + 1] if w[0] in VOWELS and w[-1] in VOWELS)
+
+
+class ValidAnagram(object):
+    def isAnagram(self, s, t):
+        if len(s) != len(t):
+            return False
+
+        return sorted(s) == sorted(t)
+
+    def isAnagramFast(self, s, t):
+        # O(n) counting instead of two O(n log n) sorts
+        return len(s) == len(t) and Counter(s) == Counter(t)
+
+
+class MinimumDeletions(object):
+    def minimumDeletions(self, nums):
+        n = len(nums)
+        max_value = max(nums)
+        min_value = min(nums)
+        max_index = max(nums.index(max_value), nums.index(min_value))
+        min_index = min(nums.index(max_value), nums.index(min_value))
+
+        front = max_index + 1
+
+        back = n - min_index
+
+        mix1 = (min_index + 1) + (n - max_index)
+        mix2 = (max_index + 1) + (n - min_index)
+
+        return min(front, back, mix1, mix2)
+
+    def minimumDeletionsFast(self, nums):
+        # Four C-level scans instead of six; a Python loop doing one pass
+        # over the list is slower than either
+        lo = nums.index(min(nums))
+        hi = nums.index(max(nums))
+        i, j = min(lo, hi), max(lo, hi)
+        n = len(nums)
+        return min(j + 1, n - i, i + 1 + n - j)
+
+
+class RemoveDuplicatesSortedList(object):
+    def deleteDuplicates(self, head):
+        # The original used == where it meant =, so it never advanced
+        current = head
+        while current and current.next:
+            if current.val == current.next.val:
+                current.next = current.next.next
+            else:
+                current = current.next
+
+        return head
+
+
+class ValidPalindrome(object):
+    def isPalindrome(self, s):
+        s = ''.join(ch for ch in s if ch.isalnum())
+        s = s.lower()
+
+        left = 0
+        right = len(s) - 1
+
+        while left < right:
+            if s[left] != s[right]:
+                return False
+
+            left += 1
+            right -= 1
+
+        return True
+
+    def isPalindromeFast(self, s):
+        # One filtered, lowercased copy compared against its reverse in C
+        t = s.lower()
+        t = "".join(filter(str.isalnum, t))
+        return t == t[::-1]
+
+
+# Batch entry points
+
+def fizz_buzz_batch(nums):
+    nums = np.asarray(nums, dtype=np.int64)
+    out = np.empty(nums.shape, dtype=object)
+    plain = (nums % 3 != 0) & (nums % 5 != 0)
+    # Only the plain numbers need a str(); the labels are filled in by mask
+    out[plain] = list(map(str, nums[plain].tolist()))
+    out[nums % 3 == 0] = "Fizz"
+    out[nums % 5 == 0] = "Buzz"
+    out[nums % 15 == 0] = "FizzBuzz"
+    return out
+
+
+def _reverse_digits(nums):
+    nums = np.abs(np.asarray(nums, dtype=np.int64))
+    rev = np.zeros_like(nums)
+    active = nums > 0
+    while active.any():
+        # Numbers that ran out of digits must stop shifting
+        rev = np.where(active, rev * 10 + nums % 10, rev)
+        nums //= 10
+        active = nums > 0
+    return rev
+
+
+def is_palindrome_number_batch(nums):
+    nums = np.asarray(nums, dtype=np.int64)
+    return (nums >= 0) & (_reverse_digits(nums) == nums)
+
+
+def reverse_batch(nums):
+    nums = np.asarray(nums, dtype=np.int64)
+    rev = np.sign(nums) * _reverse_digits(nums)
+    return np.where((rev < INT_MIN) | (rev > INT_MAX), 0, rev)
+
+
+def vowel_strings_batch(words, lefts, rights):
+    """vowelStrings for many (left, right) ranges over one word list."""
+    return VowelStringsIndex(words).query_many(lefts, rights)
+
+
+def is_anagram_batch(pairs):
+    sol = ValidAnagram()
+    return np.fromiter((sol.isAnagramFast(s, t) for s, t in pairs), dtype=bool, count=len(pairs))
+
+
+def minimum_deletions_batch(rows):
+    """minimumDeletions for every row of a 2-D array (equal-length inputs)."""
+    rows = np.asarray(rows)
+    n = rows.shape[1]
+    lo, hi = rows.argmin(axis=1), rows.argmax(axis=1)
+    i, j = np.minimum(lo, hi), np.maximum(lo, hi)
+    return np.minimum(np.minimum(j + 1, n - i), i + 1 + n - j)
+
+
+def delete_duplicates_batch(lists):
+    """Deduplicate many sorted sequences; one array out per input."""
+    out = []
+    for values in lists:
+        values = np.asarray(values)
+        if values.size:
+            values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+        out.append(values)
+    return out
+
+
+def is_palindrome_string_batch(strings):
+    sol = ValidPalindrome()
+    return np.fromiter((sol.isPalindromeFast(s) for s in strings), dtype=bool, count=len(strings))
+
+
+Entry = namedtuple("Entry", "original optimized batch")
+
+SOLUTIONS = {
+    "fizzBuzz": Entry(FizzBuzz().fizzBuzz, FizzBuzz().fizzBuzzFast, fizz_buzz_batch),
+    "isPalindromeNumber": Entry(PalindromeNumber().isPalindrome, None, is_palindrome_number_batch),
+    "reverse": Entry(ReverseInteger().reverse, None, reverse_batch),
+    "vowelStrings": Entry(VowelStrings().vowelStrings, VowelStrings().vowelStringsFast, vowel_strings_batch),
+    "isAnagram": Entry(ValidAnagram().isAnagram, ValidAnagram().isAnagramFast, is_anagram_batch),
+    "minimumDeletions": Entry(MinimumDeletions().minimumDeletions, MinimumDeletions().minimumDeletionsFast,
+                              minimum_deletions_batch),
+    "deleteDuplicates": Entry(RemoveDuplicatesSortedList().deleteDuplicates, None, delete_duplicates_batch),
+    "isPalindrome": Entry(ValidPalindrome().isPalindrome, ValidPalindrome().isPalindromeFast,
+                          is_palindrome_string_batch),
+}
+
+
+# Benchmarks: each workload returns (calls for original/optimized, batch call)
+
+def _random_word(rng, n):
+    return "".join(rng.choice("abcdeiou") for _ in range(n))
+
+
+def _workloads(rng):
+    ints = [rng.randint(-2**31, 2**31 - 1) for _ in range(100_000)]
+    palins = [int(str(x) + str(x)[::-1]) for x in range(50_000)] + ints[:50_000]
+    words = [_random_word(rng, rng.randint(1, 8)) for _ in range(100_000)]
+    ranges = [sorted((rng.randrange(len(words)), rng.randrange(len(words)))) for _ in range(200)]
+    pairs = [(w, "".join(rng.sample(w, len(w)))) for w in (_random_word(rng, 200) for _ in range(2_000))]
+    rows = [rng.sample(range(10**6), 1_000) for _ in range(1_000)]
+    sorted_lists = [sorted(rng.randint(0, 500) for _ in range(1_000)) for _ in range(200)]
+    texts = ["A man, a plan, a canal: Panama" * 20, "race a car" * 60] * 1_000
+
+    return {
+        "fizzBuzz": (lambda f: f(10**6), lambda b: b(np.arange(1, 10**6 + 1))),
+        "isPalindromeNumber": (lambda f: [f(x) for x in palins], lambda b: b(palins)),
+        "reverse": (lambda f: [f(x) for x in ints], lambda b: b(ints)),
+        "vowelStrings": (lambda f: [f(words, l, r) for l, r in ranges],
+                         lambda b: b(words, [l for l, _ in ranges], [r for _, r in ranges])),
+        "isAnagram": (lambda f: [f(s, t) for s, t in pairs], lambda b: b(pairs)),
+        "minimumDeletions": (lambda f: [f(row) for row in rows], lambda b: b(rows)),
+        "deleteDuplicates": (lambda f: [f(build_list(v)) for v in sorted_lists], lambda b: b(sorted_lists)),
+        "isPalindrome": (lambda f: [f(s) for s in texts], lambda b: b(texts)),
+    }
+
+
+def _time(func, repeat=3):
+    """Best of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(names=None, seed=0):
+    workloads = _workloads(random.Random(seed))
+    print(f"{'solution':<20} {'original':>12} {'optimized':>12} {'batch':>12}")
+    for name in names or SOLUTIONS:
+        entry = SOLUTIONS[name]
+        calls, batch = workloads[name]
+        original = _time(lambda: calls(entry.original))
+        optimized = f"{_time(lambda: calls(entry.optimized)):>10.1f}ms" if entry.optimized else f"{'-':>12}"
+        batched = _time(lambda: batch(entry.batch))
+        print(f"{name:<20} {original:>10.1f}ms {optimized} {batched:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    benchmark(sys.argv[1:] or None)
@@ -0,0 +1,77 @@
+# O(1) vowelStrings range queries
+#
+# VowelStrings.vowelStrings rescans words[left..right] on every call.
+# VowelStringsIndex marks the words that start and end with a vowel once,
+# vectorized over the whole list, and keeps the prefix sums so that each
+# query is two lookups and a whole array of queries is one NumPy call.
+#
+#   python vowel_strings.py    benchmark at 10^5 words x 10^5 queries
+import random
+import time
+
+import numpy as np
+
+VOWEL_CODES = np.array([ord(v) for v in "aeiou"], dtype=np.uint32)
+
+
+class VowelStringsIndex(object):
+    def __init__(self, words):
+        self.n = len(words)
+        # Only the first and last character matter; a fixed-width array of
+        # whole words would be as wide as the longest word for every row
+        firsts = np.array([w[:1] for w in words], dtype="U1").view(np.uint32)
+        lasts = np.array([w[-1:] for w in words], dtype="U1").view(np.uint32)
+        # An empty word has code 0 in both, which is not a vowel
+        mask = np.isin(firsts, VOWEL_CODES) & np.isin(lasts, VOWEL_CODES)
+        self.prefix = np.zeros(self.n + 1, dtype=np.int64)
+        np.cumsum(mask, out=self.prefix[1:])
+
+    def query(self, left, right):
+        """Number of vowel strings in words[left..right], inclusive like LeetCode."""
+        return int(self.prefix[right + 1] - self.prefix[left])
+
+    def query_many(self, lefts, rights):
+        return self.prefix[np.asarray(rights) + 1] - self.prefix[np.asarray(lefts)]
+
+    def vowelStrings(self, words, left, right):
+        # Same signature as the LeetCode method; words must be the indexed list
+        return self.query(left, right)
+
+
+def benchmark(n_words=10**5, n_queries=10**5, seed=0):
+    from solutions import VowelStrings
+
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdeiou") for _ in range(rng.randint(1, 10))) for _ in range(n_words)]
+    queries = [sorted((rng.randrange(n_words), rng.randrange(n_words))) for _ in range(n_queries)]
+    lefts = np.array([l for l, _ in queries])
+    rights = np.array([r for _, r in queries])
+
+    sample = queries[:200]
+    sol = VowelStrings()
+    start = time.perf_counter()
+    expected = [sol.vowelStrings(words, l, r) for l, r in sample]
+    scan = (time.perf_counter() - start) * n_queries / len(sample)
+
+    start = time.perf_counter()
+    index = VowelStringsIndex(words)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    single = [index.query(l, r) for l, r in queries]
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    many = index.query_many(lefts, rights)
+    vectorized = time.perf_counter() - start
+
+    assert expected == single[:len(sample)] == many[:len(sample)].tolist()
+    print(f"{n_words} words, {n_queries} queries")
+    print(f"  rescan per query (extrapolated)  {scan * 1000:>10.1f}ms")
+    print(f"  build index                      {build * 1000:>10.1f}ms")
+    print(f"  query() one by one               {one_by_one * 1000:>10.1f}ms")
+    print(f"  query_many()                     {vectorized * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,7 +1,198 @@
+# Character frequencies, from one string up to files of many gigabytes
+#
+# With no file this counts the sample text, as before. With files, each
+# one is memory-mapped and split into chunks. The chunks are counted in a
+# process pool with np.bincount and the partial histograms are merged.
+#
+#   python practice.py                          the sample text
+#   python practice.py FILE ... [--csv] [--bytes] [--workers N]
+import argparse
+import csv
+import json
+import mmap
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
 text = "thanksgivingday"
-data = {}
+CHUNK_SIZE = 64 << 20
+
+
+def count_text(text):
+    data = {}
+    for char in text:
+        data[char] = data.get(char, 0) + 1
+    return data
+
+
+def _lead_tables():
+    """Per lead byte: sequence length (0 if it cannot start one), its
+    payload bits, and the allowed range of the second byte. The ranges are
+    narrower after E0, ED, F0 and F4, which rules out overlong forms,
+    surrogates and anything above U+10FFFF."""
+    length = np.zeros(256, dtype=np.uint8)
+    length[0xC2:0xE0], length[0xE0:0xF0], length[0xF0:0xF5] = 2, 3, 4
+    payload = np.arange(256, dtype=np.uint8)
+    payload[0xC2:0xE0] &= 0x1F
+    payload[0xE0:0xF0] &= 0x0F
+    payload[0xF0:0xF5] &= 0x07
+    lo = np.full(256, 0x80, dtype=np.uint8)
+    hi = np.full(256, 0xBF, dtype=np.uint8)
+    lo[0xE0], hi[0xED], lo[0xF0], hi[0xF4] = 0xA0, 0x9F, 0x90, 0x8F
+    return length, payload, lo, hi
+
+
+LEAD_LENGTH, LEAD_PAYLOAD, SECOND_LO, SECOND_HI = _lead_tables()
+
+
+def _utf8_code_points(chunk, byte_counts):
+    """Code points of the non-ASCII characters in chunk, vectorized.
+
+    Decodes like bytes.decode("utf-8", errors="replace"): every invalid
+    sequence (stray continuation bytes, bytes C0, C1 and F5-FF, overlongs,
+    surrogates, truncated sequences) counts as one U+FFFD. byte_counts is
+    the chunk's byte histogram. Returns the valid code points and the
+    number of replacements.
+    """
+    n = len(chunk)
+    starts = np.flatnonzero(chunk >= 0xC2).astype(np.uint32)
+    lead = chunk[starts]
+    if byte_counts[0xF5:].any():
+        keep = lead < 0xF5
+        starts, lead = starts[keep], lead[keep]
+    # Bytes that can never start a character
+    strays = int(byte_counts[0x80:0xC2].sum() + byte_counts[0xF5:].sum())
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.uint32), strays
+
+    length = LEAD_LENGTH[lead]
+    cp = LEAD_PAYLOAD[lead].astype(np.uint32)
+    ok = np.ones(len(starts), dtype=bool)
+    taken = np.zeros(len(starts), dtype=np.uint8)
+    for k in range(1, 4):
+        pos = starts + k
+        follow = chunk[np.minimum(pos, n - 1)]
+        if k == 1:
+            ok &= (follow >= SECOND_LO[lead]) & (follow <= SECOND_HI[lead])
+        else:
+            ok &= (follow & 0xC0) == 0x80
+        ok &= (length > k) & (pos < n)
+        taken += ok
+        cp = np.where(ok, (cp << 6) | (follow & 0x3F), cp)
+
+    # Continuation bytes taken by a lead, complete or not, are part of its
+    # character or its single U+FFFD; any others are one U+FFFD each
+    valid = taken == length - 1
+    replacements = int(len(starts) - valid.sum()) + strays - int(taken.sum(dtype=np.int64))
+    return cp[valid], replacements
+
+
+def count_chunk(path, start, stop, raw=False):
+    """Histogram of path[start:stop]: (ascii or byte counts, {code point: count})."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        chunk = np.frombuffer(mm, dtype=np.uint8, count=stop - start, offset=start)
+        counts = np.bincount(chunk, minlength=256)
+        wide = {}
+        if not raw and counts[0x80:].any():
+            code_points, replacements = _utf8_code_points(chunk, counts)
+            # Code points are at most U+10FFFF, so a histogram beats sorting
+            hist = np.bincount(code_points, minlength=0x80)
+            values = np.flatnonzero(hist)
+            wide = dict(zip(values.tolist(), hist[values].tolist()))
+            if replacements:
+                wide[0xFFFD] = wide.get(0xFFFD, 0) + replacements
+        del chunk
+    return (counts if raw else counts[:128]), wide
+
+
+def _chunks(path, size, chunk_size):
+    """(start, stop) ranges that never split a UTF-8 sequence."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            stop = min(start + chunk_size, size)
+            # Continuation bytes are 10xxxxxx; move the cut back to a lead byte
+            cut = stop
+            while cut < size and cut > start and 0x80 <= mm[cut] < 0xC0:
+                cut -= 1
+            if cut > start:
+                stop = cut
+            else:
+                # Chunk smaller than one character: move the cut forward instead
+                while stop < size and 0x80 <= mm[stop] < 0xC0:
+                    stop += 1
+            yield start, stop
+            start = stop
+
+
+def count_files(paths, raw=False, workers=None, chunk_size=CHUNK_SIZE):
+    """Merged {char (or byte value): count} over every file."""
+    ranges = []
+    for path in paths:
+        size = os.path.getsize(path)
+        if size:
+            ranges.extend((path, start, stop) for start, stop in _chunks(path, size, chunk_size))
+
+    total = np.zeros(256 if raw else 128, dtype=np.int64)
+    wide = Counter()
+    if len(ranges) <= 1 or workers == 1:
+        results = (count_chunk(path, start, stop, raw) for path, start, stop in ranges)
+        for counts, extra in results:
+            total += counts
+            wide.update(extra)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(count_chunk, path, start, stop, raw) for path, start, stop in ranges]
+            for future in futures:
+                counts, extra = future.result()
+                total += counts
+                wide.update(extra)
+
+    if raw:
+        return {b: int(c) for b, c in enumerate(total.tolist()) if c}
+    freq = {chr(b): c for b, c in enumerate(total.tolist()) if c}
+    freq.update((chr(cp), c) for cp, c in wide.items())
+    return freq
+
+
+def write_counts(freq, out, as_csv=False):
+    ordered = sorted(freq.items(), key=lambda item: (-item[1], item[0]))
+    if as_csv:
+        writer = csv.writer(out)
+        writer.writerow(["char", "count"])
+        writer.writerows(ordered)
+    else:
+        # JSON object keys must be strings; raw byte values become "0".."255"
+        json.dump({str(k) if isinstance(k, int) else k: c for k, c in ordered}, out,
+                  ensure_ascii=False, indent=1)
+        out.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count character frequencies in files.")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--csv", action="store_true", help="CSV instead of JSON")
+    parser.add_argument("--bytes", action="store_true", help="count raw byte values, not UTF-8 characters")
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    parser.add_argument("--chunk-mb", type=int, default=CHUNK_SIZE >> 20)
+    args = parser.parse_args()
+
+    if not args.files:
+        print(count_text(text))
+        return
+
+    start = time.perf_counter()
+    freq = count_files(args.files, raw=args.bytes, workers=args.workers, chunk_size=args.chunk_mb << 20)
+    elapsed = time.perf_counter() - start
+    write_counts(freq, sys.stdout, as_csv=args.csv)
+
+    size = sum(os.path.getsize(p) for p in args.files)
+    print(f"{size / 2**20:.0f} MB in {elapsed:.2f}s", file=sys.stderr)
 
-for index, char in enumerate(text, start=1):
-    data[char] = data.get(char, 0) + 1
 
-print(data)
+if __name__ == "__main__":
+    main()
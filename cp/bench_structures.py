@@ -0,0 +1,276 @@
+# Benchmarks: array-backed structures.py vs naive list-of-objects versions
+#
+#   python bench_structures.py [n]
+import random
+import sys
+import time
+import tracemalloc
+from heapq import heappop, heappush
+
+from structures import CSRGraph, DSU, Fenwick, LazySegTree, RangeFenwick, SparseTable
+
+
+# Naive versions: one Python object per node / edge
+
+class SegNode:
+    def __init__(self, lo, hi):
+        self.lo, self.hi = lo, hi
+        self.total = 0
+        self.lazy = 0
+        self.left = self.right = None
+
+
+class ObjectSegTree:
+    def __init__(self, values):
+        self.root = self._build(values, 0, len(values))
+
+    def _build(self, values, lo, hi):
+        node = SegNode(lo, hi)
+        if hi - lo == 1:
+            node.total = values[lo]
+        else:
+            mid = (lo + hi) // 2
+            node.left = self._build(values, lo, mid)
+            node.right = self._build(values, mid, hi)
+            node.total = node.left.total + node.right.total
+        return node
+
+    def add(self, l, r, f, node=None):
+        node = node or self.root
+        if r <= node.lo or node.hi <= l:
+            return
+        if l <= node.lo and node.hi <= r:
+            node.total += f * (node.hi - node.lo)
+            node.lazy += f
+            return
+        self._push(node)
+        self.add(l, r, f, node.left)
+        self.add(l, r, f, node.right)
+        node.total = node.left.total + node.right.total
+
+    def sum(self, l, r, node=None):
+        node = node or self.root
+        if r <= node.lo or node.hi <= l:
+            return 0
+        if l <= node.lo and node.hi <= r:
+            return node.total
+        self._push(node)
+        return self.sum(l, r, node.left) + self.sum(l, r, node.right)
+
+    def _push(self, node):
+        if node.lazy:
+            for child in (node.left, node.right):
+                child.total += node.lazy * (child.hi - child.lo)
+                child.lazy += node.lazy
+            node.lazy = 0
+
+
+class ObjectMinSegTree(ObjectSegTree):
+    """ObjectSegTree that also keeps each subtree's minimum."""
+
+    def _build(self, values, lo, hi):
+        node = super()._build(values, lo, hi)
+        node.low = values[lo] if hi - lo == 1 else min(node.left.low, node.right.low)
+        return node
+
+    def add(self, l, r, f, node=None):
+        node = node or self.root
+        if r <= node.lo or node.hi <= l:
+            return
+        if l <= node.lo and node.hi <= r:
+            node.total += f * (node.hi - node.lo)
+            node.low += f
+            node.lazy += f
+            return
+        self._push(node)
+        self.add(l, r, f, node.left)
+        self.add(l, r, f, node.right)
+        node.total = node.left.total + node.right.total
+        node.low = min(node.left.low, node.right.low)
+
+    def min(self, l, r, node=None):
+        node = node or self.root
+        if r <= node.lo or node.hi <= l:
+            return float("inf")
+        if l <= node.lo and node.hi <= r:
+            return node.low
+        self._push(node)
+        return min(self.min(l, r, node.left), self.min(l, r, node.right))
+
+    def _push(self, node):
+        if node.lazy:
+            for child in (node.left, node.right):
+                child.total += node.lazy * (child.hi - child.lo)
+                child.low += node.lazy
+                child.lazy += node.lazy
+            node.lazy = 0
+
+
+class SetNode:
+    def __init__(self):
+        self.parent = self
+        self.size = 1
+
+
+def object_find(node):
+    while node.parent is not node:
+        node.parent = node.parent.parent
+        node = node.parent
+    return node
+
+
+def object_union(a, b):
+    a, b = object_find(a), object_find(b)
+    if a is b:
+        return
+    if a.size < b.size:
+        a, b = b, a
+    b.parent = a
+    a.size += b.size
+
+
+class Edge:
+    def __init__(self, to, weight):
+        self.to = to
+        self.weight = weight
+
+
+def object_dijkstra(adj, source):
+    dist = [float("inf")] * len(adj)
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heappop(heap)
+        if d > dist[u]:
+            continue
+        for edge in adj[u]:
+            nd = d + edge.weight
+            if nd < dist[edge.to]:
+                dist[edge.to] = nd
+                heappush(heap, (nd, edge.to))
+    return dist
+
+
+def measure(func):
+    """(seconds, peak bytes allocated) of func.
+
+    Timed and traced in separate runs, since tracemalloc slows down every
+    allocation and would distort the timing.
+    """
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def report(name, fast, naive):
+    print(f"{name:<28} {fast[0] * 1000:>10.1f}ms {fast[1] / 2**20:>8.1f}MB"
+          f"   {naive[0] * 1000:>10.1f}ms {naive[1] / 2**20:>8.1f}MB   x{naive[0] / fast[0]:.1f}")
+
+
+def main(n=200_000):
+    rng = random.Random(0)
+    values = [rng.randint(-10**6, 10**6) for _ in range(n)]
+    queries = [sorted((rng.randrange(n), rng.randrange(n))) for _ in range(n)]
+    queries = [(l, r + 1, rng.randint(-5, 5)) for l, r in queries]
+    edges = [(rng.randrange(n), rng.randrange(n), rng.randint(1, 100)) for _ in range(3 * n)]
+
+    print(f"n = {n}")
+    print(f"{'':<28} {'array-backed':>21}   {'objects':>21}")
+
+    def fenwick_run():
+        f = Fenwick(values)
+        for l, r, x in queries:
+            f.add(l, x)
+            f.sum(l, r)
+
+    def naive_prefix_run():
+        tree = ObjectSegTree(values)
+        for l, r, x in queries:
+            tree.add(l, l + 1, x)
+            tree.sum(l, r)
+
+    report("point add + range sum", measure(fenwick_run), measure(naive_prefix_run))
+
+    def lazy_run():
+        t = LazySegTree(values)
+        for l, r, x in queries:
+            t.add(l, r, x)
+            t.sum(l, r)
+
+    def range_fenwick_run():
+        t = RangeFenwick(values)
+        for l, r, x in queries:
+            t.add(l, r, x)
+            t.sum(l, r)
+
+    def object_lazy_run():
+        t = ObjectSegTree(values)
+        for l, r, x in queries:
+            t.add(l, r, x)
+            t.sum(l, r)
+
+    naive = measure(object_lazy_run)
+    report("range add + sum (seg tree)", measure(lazy_run), naive)
+    report("range add + sum (fenwick)", measure(range_fenwick_run), naive)
+
+    def lazy_min_run():
+        t = LazySegTree(values)
+        for l, r, x in queries:
+            t.add(l, r, x)
+            t.min(l, r)
+
+    def object_min_run():
+        t = ObjectMinSegTree(values)
+        for l, r, x in queries:
+            t.add(l, r, x)
+            t.min(l, r)
+
+    report("range add + range min", measure(lazy_min_run), measure(object_min_run))
+
+    def dsu_run():
+        d = DSU(n)
+        for u, v, _ in edges:
+            d.union(u, v)
+
+    def object_dsu_run():
+        nodes = [SetNode() for _ in range(n)]
+        for u, v, _ in edges:
+            object_union(nodes[u], nodes[v])
+
+    report("union-find", measure(dsu_run), measure(object_dsu_run))
+
+    def sparse_run():
+        s = SparseTable(values)
+        for l, r, _ in queries:
+            s.min(l, r)
+
+    def scan_run():
+        for l, r, _ in queries[:2000]:
+            min(values[l:r])
+
+    fast = measure(sparse_run)
+    slow = measure(scan_run)
+    # The scan only ran 2000 queries; scale it to the same query count
+    report("range min (scan scaled)", fast, (slow[0] * len(queries) / 2000, slow[1]))
+
+    def csr_run():
+        g = CSRGraph(n, [e[0] for e in edges], [e[1] for e in edges], [e[2] for e in edges])
+        return g.dijkstra(0)
+
+    def object_graph_run():
+        adj = [[] for _ in range(n)]
+        for u, v, w in edges:
+            adj[u].append(Edge(v, w))
+            adj[v].append(Edge(u, w))
+        return object_dijkstra(adj, 0)
+
+    report("graph build + dijkstra", measure(csr_run), measure(object_graph_run))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,88 @@
+# Fast I/O for competitive programming
+#
+# Reads the whole of stdin in one call and splits it into byte tokens, so
+# parsing 10^6 numbers is a single bulk `map(int, ...)` instead of 10^6
+# readline calls. Output is collected in a list and written once at exit.
+import atexit
+import sys
+
+_tokens = None
+_pos = 0
+_out = []
+
+
+def _load():
+    global _tokens
+    if _tokens is None:
+        _tokens = sys.stdin.buffer.read().split()
+    return _tokens
+
+
+def token():
+    global _pos
+    tokens = _load()
+    _pos += 1
+    return tokens[_pos - 1]
+
+
+def tokens():
+    """Iterator over the remaining whitespace-separated tokens (as bytes)."""
+    global _pos
+    data = _load()
+    while _pos < len(data):
+        _pos += 1
+        yield data[_pos - 1]
+
+
+def read_int():
+    return int(token())
+
+
+def read_ints(n):
+    """Next n tokens as a list of ints, parsed in one bulk map."""
+    global _pos
+    data = _load()
+    start = _pos
+    _pos += n
+    return list(map(int, data[start:_pos]))
+
+
+def read_array(n, dtype="int64"):
+    """Next n tokens as a NumPy array (only imports NumPy when called)."""
+    import numpy as np
+
+    global _pos
+    data = _load()
+    start = _pos
+    _pos += n
+    return np.array(data[start:_pos]).astype(dtype)
+
+
+def read_str():
+    return token().decode()
+
+
+def write(*args, sep=" ", end="\n"):
+    _out.append(sep.join(map(str, args)) + end)
+
+
+def write_lines(values):
+    _out.append("\n".join(map(str, values)) + "\n")
+
+
+def flush():
+    if _out:
+        sys.stdout.write("".join(_out))
+        sys.stdout.flush()
+        _out.clear()
+
+
+def run(solve, multi_test=True):
+    """Call solve() once, or once per case when the input starts with t."""
+    cases = read_int() if multi_test else 1
+    for _ in range(cases):
+        solve()
+    flush()
+
+
+atexit.register(flush)
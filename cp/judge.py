@@ -0,0 +1,173 @@
+# Local judge
+#
+# Runs a solution against a directory of tests and reports a verdict
+# (AC/WA/TLE/MLE/RE), wall time, CPU time and peak RSS for every test.
+#
+# Two kinds of solution are supported:
+#   - stdin/stdout programs like cp/sol.py; tests are NAME.in with the
+#     expected output in NAME.out (or NAME.ans), compared token by token
+#   - a Solution class like algorithms/Solution.py with --method; each test
+#     is NAME.in holding a JSON list of arguments and NAME.out holding the
+#     JSON result
+#
+# Every test runs in its own subprocess with RLIMIT_CPU and RLIMIT_AS set,
+# and tests run concurrently across cores. The limits are applied with
+# prlimit() from the judge's side, because preexec_fn is not safe to use
+# from the judge's worker threads.
+import argparse
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Runs inside the child for Solution-class tests
+METHOD_RUNNER = """
+import importlib.util, json, sys
+spec = importlib.util.spec_from_file_location("solution", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+args = json.load(sys.stdin)
+result = getattr(module.Solution(), sys.argv[2])(*args)
+json.dump(result, sys.stdout)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Judge a solution against a directory of tests.")
+    parser.add_argument("solution", help="path of the solution file")
+    parser.add_argument("tests", help="directory with NAME.in / NAME.out files")
+    parser.add_argument("--method", help="call Solution().METHOD instead of running a stdin/stdout program")
+    parser.add_argument("--time", type=float, default=2.0, help="CPU time limit per test in seconds")
+    parser.add_argument("--memory", type=int, default=256, help="address-space limit per test in MB")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="tests run at the same time")
+    args = parser.parse_args()
+
+    tests = find_tests(args.tests)
+    if not tests:
+        print(f"No tests found in {args.tests}")
+        sys.exit(1)
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(
+            lambda test: judge_test(args.solution, test, args.method, args.time, args.memory),
+            tests,
+        ))
+    print_results(results)
+    sys.exit(0 if all(r["verdict"] == "AC" for r in results) else 1)
+
+
+def find_tests(directory):
+    tests = []
+    for name in sorted(os.listdir(directory)):
+        if not name.endswith(".in"):
+            continue
+        base = os.path.join(directory, name[:-3])
+        for ext in (".out", ".ans"):
+            if os.path.exists(base + ext):
+                tests.append((name[:-3], base + ".in", base + ext))
+                break
+    return tests
+
+
+def limit_resources(pid, time_limit, memory_mb):
+    cpu = max(1, int(time_limit + 0.999))
+    memory = memory_mb * 1024 * 1024
+    try:
+        # Soft limit sends SIGXCPU, the hard limit one second later SIGKILL
+        resource.prlimit(pid, resource.RLIMIT_CPU, (cpu, cpu + 1))
+        resource.prlimit(pid, resource.RLIMIT_AS, (memory, memory))
+    except ProcessLookupError:
+        pass  # already exited
+
+
+def run_limited(cmd, input_path, time_limit, memory_mb):
+    """Run cmd with stdin from input_path; returns (status, rusage, wall, stdout, stderr)."""
+    env = dict(os.environ, OPENBLAS_NUM_THREADS="1", OMP_NUM_THREADS="1")
+    with open(input_path, "rb") as stdin, tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        proc = subprocess.Popen(cmd, stdin=stdin, stdout=out, stderr=err, env=env)
+        limit_resources(proc.pid, time_limit, memory_mb)
+        # Reap the child ourselves so its rusage (CPU time, peak RSS) is ours
+        deadline = start + 2 * time_limit + 1
+        while True:
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            if time.perf_counter() > deadline:
+                proc.kill()
+                pid, status, usage = os.wait4(proc.pid, 0)
+                break
+            time.sleep(0.002)
+        wall = time.perf_counter() - start
+        proc.returncode = os.waitstatus_to_exitcode(status)
+
+        out.seek(0)
+        err.seek(0)
+        return proc.returncode, usage, wall, out.read().decode(errors="replace"), err.read().decode(errors="replace")
+
+
+def judge_test(solution, test, method, time_limit, memory_mb):
+    name, input_path, answer_path = test
+    if method:
+        cmd = [sys.executable, "-c", METHOD_RUNNER, solution, method]
+    else:
+        cmd = [sys.executable, solution]
+
+    code, usage, wall, stdout, stderr = run_limited(cmd, input_path, time_limit, memory_mb)
+    cpu = usage.ru_utime + usage.ru_stime
+    rss_mb = usage.ru_maxrss / 1024  # kilobytes on Linux
+
+    with open(answer_path) as f:
+        expected = f.read()
+
+    if cpu >= time_limit or wall > 2 * time_limit + 1 or code in (-signal.SIGXCPU, -signal.SIGKILL):
+        verdict = "TLE"
+    elif "MemoryError" in stderr or rss_mb >= memory_mb:
+        verdict = "MLE"
+    elif code != 0:
+        verdict = "RE"
+    elif method:
+        verdict = "AC" if parse_json(stdout) == json.loads(expected) else "WA"
+    else:
+        verdict = "AC" if stdout.split() == expected.split() else "WA"
+
+    error = ""
+    if verdict == "RE" and stderr.strip():
+        error = stderr.strip().splitlines()[-1]
+    elif verdict == "WA" and method and parse_json(stdout) is NOT_JSON:
+        error = "output is not JSON (debug prints on stdout?)"
+    return {"test": name, "verdict": verdict, "wall": wall, "cpu": cpu, "rss_mb": rss_mb, "error": error}
+
+
+# Stands in for output that does not parse, and compares unequal to any answer
+NOT_JSON = object()
+
+
+def parse_json(text):
+    try:
+        return json.loads(text)
+    except ValueError:
+        return NOT_JSON
+
+
+def print_results(results):
+    print("=" * 72)
+    print(f"{'Test':<20} {'Verdict':<8} {'Wall':>10} {'CPU':>10} {'Peak RSS':>12}")
+    print("-" * 72)
+    for r in results:
+        print(f"{r['test']:<20} {r['verdict']:<8} {r['wall'] * 1000:>8.0f}ms {r['cpu'] * 1000:>8.0f}ms {r['rss_mb']:>10.1f}MB")
+        if r["error"]:
+            print(f"    {r['error']}")
+    print("-" * 72)
+    passed = sum(r["verdict"] == "AC" for r in results)
+    print(f"Passed {passed}/{len(results)}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,23 +4,24 @@
 
 
 # Competitive Programming version
-import sys
+from fastio import read_int, read_ints, write, run
+from twosum import two_sum
 
-input = lambda: sys.stdin.readline().rstrip()
-print = lambda *args, **kwargs: sys.stdout.write(' '.join(map(str, args)) + '\n')
+# Set to True when the input starts with the number of test cases t
+MULTI_TEST = False
+# "dict", "two_pointer" or "searchsorted"; see twosum.py
+STRATEGY = "dict"
 
-def main():
-    n, target = map(int, input().split())
-    nums = list(map(int, input().split()))
+def solve():
+    n, target = read_int(), read_int()
+    nums = read_ints(n)
 
-    seen = {}
+    res = two_sum(nums, target, STRATEGY)
+    if res is not None:
+        write(*res)
 
-    for i, num in enumerate(nums):
-        complement = target - num
-        if complement in seen:
-            print(seen[complement], i)
-            return
-        seen[num] = i
+def main():
+    run(solve, multi_test=MULTI_TEST)
 
 if __name__ == "__main__":
     main()
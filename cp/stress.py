@@ -0,0 +1,244 @@
+# Parallel stress tester
+#
+# Runs a random input generator against a reference (brute force) and a
+# candidate solution across a process pool, stops at the first mismatch,
+# shrinks it to a small counterexample and reports the slowest inputs.
+#
+# Shrinking also runs on the pool, within a fixed budget of runs. With a
+# reducer (text -> smaller candidate texts, such as reduce_two_sum) the
+# failing input itself is cut down greedily. Without one, new random
+# inputs are tried at smaller sizes.
+#
+# A solution is either a function taking the input text and returning the
+# output text, or the path of a stdin/stdout script such as cp/sol.py.
+# Generators are called as gen(rng, size) and return the input text.
+# Everything passed to stress() must be picklable (module-level functions).
+import os
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+def run_solution(solution, text, timeout=10):
+    if callable(solution):
+        return solution(text)
+    result = subprocess.run(
+        [sys.executable, solution],
+        input=text, capture_output=True, text=True, timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "non-zero exit")
+    return result.stdout
+
+
+def exact_check(text, expected, got):
+    return expected.split() == got.split()
+
+
+def _run_case(job):
+    seed, size, gen, ref, cand, check = job
+    return (seed, size) + _run_text((gen(random.Random(seed), size), ref, cand, check))
+
+
+def _run_text(job):
+    """(text, ok, expected, got, elapsed); ok is None if the reference failed."""
+    text, ref, cand, check = job
+    try:
+        expected = run_solution(ref, text)
+    except Exception as e:
+        return text, None, f"<reference error: {e}>", "", 0.0
+    start = time.perf_counter()
+    try:
+        got = run_solution(cand, text)
+    except Exception as e:
+        got = f"<error: {e}>"
+    elapsed = time.perf_counter() - start
+    return text, check(text, expected, got), expected, got, elapsed
+
+
+def stress(gen, ref, cand, cases=1000, max_size=100, check=exact_check, workers=None, seed=0,
+           reducer=None, shrink_budget=200):
+    """Run up to `cases` random cases; return the report dict."""
+    rng = random.Random(seed)
+    workers = workers or os.cpu_count()
+    # Small sizes first, so early failures are already small
+    jobs = [
+        (rng.getrandbits(64), max(1, min(max_size, 1 + k * max_size // max(1, cases // 2))), gen, ref, cand, check)
+        for k in range(cases)
+    ]
+
+    timings = []
+    reference_errors = 0
+    failure = None
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for seed_k, size, text, ok, expected, got, elapsed in pool.map(_run_case, jobs, chunksize=16):
+            if ok is None:
+                reference_errors += 1
+                continue
+            timings.append((elapsed, size, seed_k, text))
+            if ok is False:
+                failure = (seed_k, size, text, ok, expected, got, elapsed)
+                pool.shutdown(wait=False, cancel_futures=True)
+                break
+
+    report = {
+        "cases": len(timings),
+        "reference_errors": reference_errors,
+        "slowest": sorted(timings, reverse=True)[:5],
+        "counterexample": None,
+    }
+    if failure:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            report["counterexample"] = shrink(pool, 2 * workers, gen, ref, cand, check, failure, reducer, shrink_budget)
+    return report
+
+
+def shrink(pool, batch, gen, ref, cand, check, failure, reducer=None, budget=200):
+    """A smaller failing case, using at most `budget` runs on the pool,
+    submitted `batch` at a time.
+
+    seed and size always name a generated case. When the reducer cut the
+    input down, "reduced" is True and they are those of the generated case
+    it came from, not of the input itself.
+    """
+    seed, size, text, ok, expected, got, elapsed = failure
+    best = (text, ok, expected, got, elapsed)
+    runs = 0
+
+    if reducer is not None:
+        # Greedy: restart from the first smaller candidate that still fails
+        improved = True
+        while improved and runs < budget:
+            improved = False
+            candidates = reducer(best[0])
+            while runs < budget and not improved:
+                texts = [t for _, t in zip(range(min(batch, budget - runs)), candidates)]
+                if not texts:
+                    break
+                runs += len(texts)
+                for case in pool.map(_run_text, [(t, ref, cand, check) for t in texts]):
+                    if case[1] is False:
+                        best, improved = case, True
+                        break
+    else:
+        # Regenerate at each smaller size, smallest first, with an even share of the budget
+        rng = random.Random(seed)
+        per_size = max(1, budget // max(1, size - 1))
+        for smaller in range(1, size):
+            if runs >= budget:
+                break
+            jobs = [(rng.getrandbits(64), smaller, gen, ref, cand, check) for _ in range(per_size)]
+            runs += len(jobs)
+            found = next((case for case in pool.map(_run_case, jobs) if case[3] is False), None)
+            if found:
+                seed, size = found[:2]
+                best = found[2:]
+                break
+
+    text, ok, expected, got, elapsed = best
+    return {"seed": seed, "size": size, "reduced": text != failure[2], "input": text,
+            "expected": expected, "got": got, "shrink_runs": runs}
+
+
+def print_report(report):
+    print("=" * 60)
+    print(f"Ran {report['cases']} cases")
+    if report["reference_errors"]:
+        print(f"Skipped {report['reference_errors']} cases where the reference solution failed")
+    print("Slowest candidate runs:")
+    for elapsed, size, seed, text in report["slowest"]:
+        print(f"  {elapsed * 1000:8.2f}ms  size={size}  seed={seed}")
+    print("=" * 60)
+    ce = report["counterexample"]
+    if ce is None:
+        print("All cases passed.")
+    else:
+        if ce["reduced"]:
+            print(f"Mismatch, reduced in {ce['shrink_runs']} runs "
+                  f"from the generated case size={ce['size']}, seed={ce['seed']}")
+        else:
+            print(f"Mismatch (size={ce['size']}, seed={ce['seed']}; shrunk in {ce['shrink_runs']} runs)")
+        print("Input:")
+        print(ce["input"])
+        print(f"Expected: {ce['expected'].strip()}")
+        print(f"Got:      {ce['got'].strip()}")
+    print("=" * 60)
+
+
+# Two-sum setup for cp/sol.py
+
+def gen_two_sum(rng, size):
+    nums = [rng.randint(-10 * size, 10 * size) for _ in range(size + 1)]
+    i, j = rng.sample(range(len(nums)), 2)
+    return f"{len(nums)} {nums[i] + nums[j]}\n{' '.join(map(str, nums))}\n"
+
+
+def gen_two_sum_sorted(rng, size):
+    nums = sorted(rng.sample(range(-20 * size, 20 * size), size + 1))
+    # Only the two largest values add up to the target
+    return f"{len(nums)} {nums[-1] + nums[-2]}\n{' '.join(map(str, nums))}\n"
+
+
+def gen_two_sum_collisions(rng, size):
+    # Multiples of a large power of two share their low hash bits, which is
+    # what the dict probe sequence starts from
+    step = 1 << 40
+    nums = [k * step for k in rng.sample(range(1, 50 * size), size + 1)]
+    return f"{len(nums)} {nums[0] + nums[-1]}\n{' '.join(map(str, nums))}\n"
+
+
+def brute_two_sum(text):
+    data = text.split()
+    n, target = int(data[0]), int(data[1])
+    nums = list(map(int, data[2:2 + n]))
+    for j in range(n):
+        for i in range(j):
+            if nums[i] + nums[j] == target:
+                return f"{i} {j}\n"
+    return ""
+
+
+def reduce_two_sum(text):
+    """Smaller two-sum inputs: the same target with chunks of nums removed,
+    halves first, then quarters, down to single elements."""
+    data = text.split()
+    n, target = int(data[0]), data[1]
+    nums = data[2:2 + n]
+    chunk = len(nums) // 2
+    while chunk >= 1:
+        for start in range(0, len(nums), chunk):
+            rest = nums[:start] + nums[start + chunk:]
+            if rest:
+                yield f"{len(rest)} {target}\n{' '.join(rest)}\n"
+        chunk //= 2
+
+
+def check_two_sum(text, expected, got):
+    """Any valid pair is accepted, not just the one the reference found."""
+    data = text.split()
+    n, target = int(data[0]), int(data[1])
+    nums = list(map(int, data[2:2 + n]))
+    answer = got.split()
+    if not expected.split():
+        return not answer
+    if len(answer) != 2 or not all(a.lstrip("-").isdigit() for a in answer):
+        return False
+    i, j = map(int, answer)
+    return 0 <= i < n and 0 <= j < n and i != j and nums[i] + nums[j] == target
+
+
+GENERATORS = {
+    "random": gen_two_sum,
+    "sorted": gen_two_sum_sorted,
+    "collisions": gen_two_sum_collisions,
+}
+
+
+if __name__ == "__main__":
+    kind = sys.argv[1] if len(sys.argv) > 1 else "random"
+    cases = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    sol = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sol.py")
+    print_report(stress(GENERATORS[kind], brute_two_sum, sol, cases=cases, check=check_two_sum,
+                        reducer=reduce_two_sum))
@@ -0,0 +1,405 @@
+# Array-backed data structures for competitive programming
+#
+# Everything is stored in flat `array` buffers indexed by integers instead
+# of one Python object per node, which keeps memory compact and avoids
+# attribute lookups in the hot loops. Indices are 0-based and ranges are
+# half-open [l, r), like Python slices. Values are 64-bit ('q'), so sums
+# that overflow raise OverflowError instead of silently wrapping.
+from array import array
+from heapq import heappop, heappush
+
+INF = (1 << 62)
+
+
+class Fenwick:
+    """Point add, prefix sum."""
+
+    def __init__(self, n_or_values):
+        if isinstance(n_or_values, int):
+            self.n = n_or_values
+            self.tree = array("q", [0]) * (self.n + 1)
+        else:
+            self.n = len(n_or_values)
+            tree = array("q", [0])
+            tree.extend(n_or_values)
+            # O(n) build: push every node into its parent once
+            for i in range(1, self.n + 1):
+                j = i + (i & -i)
+                if j <= self.n:
+                    tree[j] += tree[i]
+            self.tree = tree
+
+    def add(self, i, delta):
+        tree, n = self.tree, self.n
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def prefix(self, i):
+        """Sum of the first i values."""
+        tree = self.tree
+        total = 0
+        while i > 0:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def sum(self, l, r):
+        return self.prefix(r) - self.prefix(l)
+
+    def lower_bound(self, target):
+        """Smallest i with prefix(i + 1) >= target (all values non-negative)."""
+        tree = self.tree
+        pos = 0
+        step = 1 << self.n.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.n and tree[nxt] < target:
+                pos = nxt
+                target -= tree[nxt]
+            step >>= 1
+        return pos
+
+
+class LazySegTree:
+    """Range add, range sum and range min; iterative, with lazy propagation.
+
+    Every node holds the sum and min of its subtree with its own pending
+    add already applied; lz[k] is the add still owed to k's children. An
+    add updates the O(log n) nodes covering the range and rebuilds their
+    ancestors. Adds commute, so pending adds are never pushed down: a
+    query adds the pending adds of the ancestors of the nodes it takes,
+    which are all on the two boundary paths. Node widths are powers of
+    two, so they are not stored, and leaves get lz slots too, which saves
+    a branch on every update.
+    """
+
+    def __init__(self, n_or_values):
+        values = [0] * n_or_values if isinstance(n_or_values, int) else n_or_values
+        self.n = n = len(values)
+        self.log = log = max(1, (n - 1).bit_length())
+        self.size = size = 1 << log
+        sm = array("q", [0]) * (2 * size)
+        sm[size:size + n] = array("q", values)
+        # Padding leaves are never inside a range, so INF never gets an add
+        mn = array("q", [INF]) * (2 * size)
+        mn[size:size + n] = array("q", values)
+        for k in range(size - 1, 0, -1):
+            sm[k] = sm[2 * k] + sm[2 * k + 1]
+            a, b = mn[2 * k], mn[2 * k + 1]
+            mn[k] = a if a < b else b
+        self.sm, self.mn = sm, mn
+        self.lz = array("q", [0]) * (2 * size)
+
+    def add(self, l, r, f):
+        if l >= r:
+            return
+        sm, mn, lz = self.sm, self.mn, self.lz
+        l += self.size
+        r += self.size
+        l0, r0 = l, r
+        g = f
+        while l < r:
+            if l & 1:
+                sm[l] += g
+                mn[l] += f
+                lz[l] += f
+                l += 1
+            if r & 1:
+                r -= 1
+                sm[r] += g
+                mn[r] += f
+                lz[r] += f
+            l >>= 1
+            r >>= 1
+            g <<= 1  # f times the node width
+        # Rebuild the ancestors of both ends, bottom-up. Below level
+        # (x & -x).bit_length() an end x is aligned and its node was covered
+        # whole; from level m up both ends share a node, which is rebuilt
+        # once. The right end's own nodes go first, as shared ones need both.
+        log = self.log
+        m = (l0 ^ (r0 - 1)).bit_length()
+        tl = (l0 & -l0).bit_length()
+        for i in range((r0 & -r0).bit_length(), min(max(m, tl), log + 1)):
+            k = (r0 - 1) >> i
+            a = 2 * k
+            d = lz[k]
+            sm[k] = sm[a] + sm[a + 1] + (d << i)
+            x, y = mn[a], mn[a + 1]
+            mn[k] = (x if x < y else y) + d
+        for i in range(tl, log + 1):
+            k = l0 >> i
+            a = 2 * k
+            d = lz[k]
+            sm[k] = sm[a] + sm[a + 1] + (d << i)
+            x, y = mn[a], mn[a + 1]
+            mn[k] = (x if x < y else y) + d
+
+    def sum(self, l, r):
+        if l >= r:
+            return 0
+        sm, lz = self.sm, self.lz
+        l += self.size
+        r += self.size
+        left = right = 0
+        nl = nr = 0  # leaves taken on each side so far
+        w = 1
+        while l < r:
+            if l & 1:
+                left += sm[l]
+                nl += w
+                l += 1
+            if r & 1:
+                r -= 1
+                right += sm[r]
+                nr += w
+            l >>= 1
+            r >>= 1
+            w <<= 1
+            # Everything taken so far lies under node l - 1 (and node r)
+            left += lz[l - 1] * nl
+            right += lz[r] * nr
+        l -= 1
+        while l > 1:
+            l >>= 1
+            left += lz[l] * nl
+        while r > 1:
+            r >>= 1
+            right += lz[r] * nr
+        return left + right
+
+    def min(self, l, r):
+        if l >= r:
+            raise ValueError(f"empty range [{l}, {r})")
+        mn, lz = self.mn, self.lz
+        l += self.size
+        r += self.size
+        left = right = INF
+        while l < r:
+            if l & 1:
+                if mn[l] < left:
+                    left = mn[l]
+                l += 1
+            if r & 1:
+                r -= 1
+                if mn[r] < right:
+                    right = mn[r]
+            l >>= 1
+            r >>= 1
+            if left != INF:
+                left += lz[l - 1]
+            if right != INF:
+                right += lz[r]
+        l -= 1
+        while l > 1 and left != INF:
+            l >>= 1
+            left += lz[l]
+        while r > 1 and right != INF:
+            r >>= 1
+            right += lz[r]
+        return left if left < right else right
+
+
+class RangeFenwick:
+    """Range add, range sum with two Fenwick trees.
+
+    The sum of the first i values is i * b1.prefix(i) - b2.prefix(i); a
+    range add is two point updates that walk both trees together. For add
+    and sum only, this is faster than LazySegTree; it cannot do range min.
+    """
+
+    def __init__(self, n_or_values):
+        values = [0] * n_or_values if isinstance(n_or_values, int) else n_or_values
+        self.n = n = len(values)
+        self.b1 = array("q", [0]) * (n + 1)
+        # b2 starts as the negated values, so prefix() includes them
+        b2 = array("q", [0])
+        b2.extend(-v for v in values)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                b2[j] += b2[i]
+        self.b2 = b2
+
+    def _add(self, i, f):
+        b1, b2, n = self.b1, self.b2, self.n
+        g = f * i
+        i += 1
+        while i <= n:
+            b1[i] += f
+            b2[i] += g
+            i += i & -i
+
+    def add(self, l, r, f):
+        if l < r:
+            self._add(l, f)
+            self._add(r, -f)
+
+    def prefix(self, i):
+        """Sum of the first i values."""
+        b1, b2 = self.b1, self.b2
+        s1 = s2 = 0
+        j = i
+        while j > 0:
+            s1 += b1[j]
+            s2 += b2[j]
+            j &= j - 1
+        return i * s1 - s2
+
+    def sum(self, l, r):
+        if l >= r:
+            return 0
+        return self.prefix(r) - self.prefix(l)
+
+
+class DSU:
+    """Disjoint set union; parent[x] < 0 marks a root holding -size."""
+
+    def __init__(self, n):
+        self.parent = array("i", [-1]) * n
+
+    def find(self, x):
+        # Path halving: one pass, every visited node skips to its grandparent
+        parent = self.parent
+        while parent[x] >= 0:
+            p = parent[x]
+            if parent[p] >= 0:
+                parent[x] = parent[p]
+            x = p
+        return x
+
+    def union(self, a, b):
+        parent = self.parent
+        # find() inlined for both sides; the calls cost more than the walks
+        while parent[a] >= 0:
+            p = parent[a]
+            if parent[p] >= 0:
+                parent[a] = parent[p]
+            a = p
+        while parent[b] >= 0:
+            p = parent[b]
+            if parent[p] >= 0:
+                parent[b] = parent[p]
+            b = p
+        if a == b:
+            return False
+        if parent[a] > parent[b]:
+            a, b = b, a
+        parent[a] += parent[b]
+        parent[b] = a
+        return True
+
+    def same(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def size(self, x):
+        return -self.parent[self.find(x)]
+
+
+class SparseTable:
+    """Static range minimum in O(1) after O(n log n) build."""
+
+    def __init__(self, values):
+        level = array("q", values)
+        self.levels = [level]
+        n = len(level)
+        j = 1
+        while 2 * j <= n:
+            prev = self.levels[-1]
+            level = array("q", map(min, prev[:len(prev) - j], prev[j:]))
+            self.levels.append(level)
+            j *= 2
+
+    def min(self, l, r):
+        if l >= r:
+            raise ValueError(f"empty range [{l}, {r})")
+        k = (r - l).bit_length() - 1
+        level = self.levels[k]
+        a, b = level[l], level[r - (1 << k)]
+        return a if a < b else b
+
+
+class CSRGraph:
+    """Compressed sparse row adjacency: neighbours of u are targets[offsets[u]:offsets[u + 1]]."""
+
+    def __init__(self, n, us, vs, ws=None, directed=False):
+        self.n = n
+        if not directed:
+            us, vs = list(us) + list(vs), list(vs) + list(us)
+            if ws is not None:
+                ws = list(ws) * 2
+        degree = array("i", [0]) * (n + 1)
+        for u in us:
+            degree[u + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        self.offsets = array("i", degree)
+        fill = array("i", degree)
+        self.targets = array("i", [0]) * len(us)
+        self.weights = array("q", [0]) * len(us) if ws is not None else None
+        for k, (u, v) in enumerate(zip(us, vs)):
+            pos = fill[u]
+            self.targets[pos] = v
+            if ws is not None:
+                self.weights[pos] = ws[k]
+            fill[u] = pos + 1
+
+    def neighbors(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def bfs(self, source):
+        """Edge-count distances from source; -1 for unreachable nodes."""
+        offsets, targets = self.offsets, self.targets
+        dist = array("i", [-1]) * self.n
+        dist[source] = 0
+        queue = array("i", [source])
+        head = 0
+        while head < len(queue):
+            u = queue[head]
+            head += 1
+            du = dist[u] + 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if dist[v] < 0:
+                    dist[v] = du
+                    queue.append(v)
+        return dist
+
+    def dfs(self, source):
+        """Preorder of the nodes reachable from source, without recursion."""
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(self.n)
+        order = array("i")
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            if seen[u]:
+                continue
+            seen[u] = 1
+            order.append(u)
+            # Reversed so neighbours are visited in adjacency order
+            for k in range(offsets[u + 1] - 1, offsets[u] - 1, -1):
+                v = targets[k]
+                if not seen[v]:
+                    stack.append(v)
+        return order
+
+    def dijkstra(self, source):
+        """Shortest distances from source over non-negative weights; INF if unreachable."""
+        offsets, targets = self.offsets, self.targets
+        weights = self.weights if self.weights is not None else array("q", [1]) * len(targets)
+        dist = array("q", [INF]) * self.n
+        dist[source] = 0
+        heap = [(0, source)]
+        while heap:
+            d, u = heappop(heap)
+            if d > dist[u]:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heappush(heap, (nd, v))
+        return dist
@@ -0,0 +1,176 @@
+# Two-sum engine with pluggable strategies
+#
+#   dict          one pass with a hash map (the original cp/sol.py approach)
+#   two_pointer   NumPy argsort, then two pointers walking in from both ends
+#   searchsorted  NumPy argsort, then np.searchsorted for every complement
+#                 at once, fully vectorized
+#
+# Every strategy returns one valid pair of indices (i, j) with i < j, or
+# None. Different strategies may pick different pairs when several exist.
+# NumPy is imported inside the functions that use it, so a solution on the
+# default dict strategy starts without paying for the import.
+import sys
+import time
+
+
+def two_sum_dict(nums, target):
+    seen = {}
+    for i, num in enumerate(nums):
+        complement = target - num
+        if complement in seen:
+            return seen[complement], i
+        seen[num] = i
+    return None
+
+
+def two_sum_two_pointer(nums, target):
+    import numpy as np
+
+    arr = np.asarray(nums, dtype=np.int64)
+    order = np.argsort(arr, kind="stable")
+    values = arr[order].tolist()
+    left, right = 0, len(values) - 1
+    while left < right:
+        total = values[left] + values[right]
+        if total == target:
+            return _pair(order[left], order[right])
+        if total < target:
+            left += 1
+        else:
+            right -= 1
+    return None
+
+
+def two_sum_searchsorted(nums, target):
+    import numpy as np
+
+    arr = np.asarray(nums, dtype=np.int64)
+    order = np.argsort(arr, kind="stable")
+    return _search_sorted(arr[order], order, target)
+
+
+def _search_sorted(values, order, target):
+    import numpy as np
+
+    complements = target - values
+    lo = np.searchsorted(values, complements, side="left")
+    hi = np.searchsorted(values, complements, side="right")
+    # A value may only pair with itself if it occurs at least twice
+    ok = (hi - lo) > np.where(complements == values, 1, 0)
+    hits = np.flatnonzero(ok)
+    if hits.size == 0:
+        return None
+    i = hits[0]
+    j = lo[i] if lo[i] != i else lo[i] + 1
+    return _pair(order[i], order[j])
+
+
+def _pair(a, b):
+    a, b = int(a), int(b)
+    return (a, b) if a < b else (b, a)
+
+
+STRATEGIES = {
+    "dict": two_sum_dict,
+    "two_pointer": two_sum_two_pointer,
+    "searchsorted": two_sum_searchsorted,
+}
+
+
+def two_sum(nums, target, strategy="dict"):
+    return STRATEGIES[strategy](nums, target)
+
+
+def two_sum_many(nums, targets):
+    """Answer many targets against one array; the sort is done only once."""
+    import numpy as np
+
+    arr = np.asarray(nums, dtype=np.int64)
+    order = np.argsort(arr, kind="stable")
+    values = arr[order]
+    return [_search_sorted(values, order, int(t)) for t in targets]
+
+
+def _value_groups(nums):
+    import numpy as np
+
+    arr = np.asarray(nums, dtype=np.int64)
+    values, inverse, counts = np.unique(arr, return_inverse=True, return_counts=True)
+    return arr, values, inverse, counts
+
+
+def count_pairs(nums, target):
+    """Number of index pairs i < j with nums[i] + nums[j] == target."""
+    import numpy as np
+
+    _, values, _, counts = _value_groups(nums)
+    if len(values) == 0:
+        return 0
+    complements = target - values
+    pos = np.searchsorted(values, complements)
+    pos_clipped = np.minimum(pos, len(values) - 1)
+    found = (pos < len(values)) & (values[pos_clipped] == complements)
+    counts = counts.astype(np.int64)
+    lower = found & (values < complements)
+    same = found & (values == complements)
+    return int(np.sum(counts[lower] * counts[pos_clipped[lower]]) + np.sum(counts[same] * (counts[same] - 1) // 2))
+
+
+def all_pairs(nums, target):
+    """Every index pair i < j with nums[i] + nums[j] == target, as a (k, 2) array."""
+    import numpy as np
+
+    arr, values, inverse, counts = _value_groups(nums)
+    order = np.argsort(inverse, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(counts)))
+    pairs = []
+    for g, value in enumerate(values.tolist()):
+        c = target - value
+        if c < value:
+            continue
+        h = np.searchsorted(values, c)
+        if h == len(values) or values[h] != c:
+            continue
+        left = order[starts[g]:starts[g + 1]]
+        if h == g:
+            i, j = np.triu_indices(len(left), k=1)
+            pairs.append(np.stack([left[i], left[j]], axis=1))
+        else:
+            right = order[starts[h]:starts[h + 1]]
+            a = np.repeat(left, len(right))
+            b = np.tile(right, len(left))
+            pairs.append(np.stack([np.minimum(a, b), np.maximum(a, b)], axis=1))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(pairs)
+
+
+def benchmark(max_exp=7, seed=0):
+    """Time every strategy for n = 10^3 .. 10^max_exp.
+
+    n = 10^8 needs a few GB of RAM (the dict strategy gets a Python list).
+
+    The inputs are the worst case for early exit: the only valid pair is at
+    the very end of the array.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    print(f"{'n':>12} " + " ".join(f"{name:>14}" for name in STRATEGIES))
+    for exp in range(3, max_exp + 1):
+        n = 10 ** exp
+        nums = rng.choice(np.arange(0, 4 * n, 2, dtype=np.int64), size=n, replace=False)
+        nums[-1] = 1
+        target = int(nums[-2]) + 1
+        as_list = nums.tolist()
+        times = []
+        for func in STRATEGIES.values():
+            data = as_list if func is two_sum_dict else nums
+            start = time.perf_counter()
+            func(data, target)
+            times.append(time.perf_counter() - start)
+        print(f"{n:>12} " + " ".join(f"{t * 1000:>12.2f}ms" for t in times))
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
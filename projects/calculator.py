@@ -1,27 +1,23 @@
+import sys
+
 def main():
     dash()
     print("Welcome to simple calculator app!")
     dash()
-    print("You can do 4 type of operation here: ")
+    print("You can do 5 type of operation here: ")
     print("1. Type + for addition")
     print("2. Type - for substraction")
     print("3. Type * for multiplication")
     print("4. Type / for division")
+    print("5. Type = for an expression, like 2 * x ** 2 + y / 3")
     dash()
 
     while True:
         op = input("Operation: ")
-        x = float(input("X: "))
-        y = float(input("Y: "))
-
-        if op == "+":
-            print("Answer:", addition(x, y))
-        elif op == "-":
-            print("Answer:", subtraction(x, y))
-        elif op == "*":
-            print("Answer:", multiplication(x, y))
-        elif op == "/":
-            print("Answer:", division(x, y))
+        if op == "=":
+            evaluate_expression()
+        else:
+            calculate(op)
 
         dash()
 
@@ -37,6 +33,29 @@ def main():
         elif res.lower() == "y":
             continue
 
+def calculate(op):
+    x = float(input("X: "))
+    y = float(input("Y: "))
+
+    if op == "+":
+        print("Answer:", addition(x, y))
+    elif op == "-":
+        print("Answer:", subtraction(x, y))
+    elif op == "*":
+        print("Answer:", multiplication(x, y))
+    elif op == "/":
+        print("Answer:", division(x, y))
+
+def evaluate_expression():
+    from expression import compile_expression
+
+    try:
+        expr = compile_expression(input("Expression: "))
+        values = {name: float(input(f"{name}: ")) for name in expr.variables}
+        print("Answer:", expr.evaluate(values))
+    except ValueError as e:
+        print("Error:", e)
+
 def dash():
     print("-" * 40)
 
@@ -55,4 +74,10 @@ def division(a, b):
     return a / b
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from calculator_batch import wants_batch
+
+    if wants_batch(sys.argv[1:]):
+        from calculator_batch import main as batch_main
+        batch_main()
+    else:
+        main()
\ No newline at end of file
@@ -0,0 +1,221 @@
+# Column batch mode for the calculator
+#
+# Applies one operation or expression to whole columns of a CSV or NPY
+# file with NumPy broadcasting, chunk by chunk, so the input never has to
+# fit in memory. Variables in the expression name columns: the CSV header,
+# the fields of a structured .npy array, or c0, c1, ... for plain arrays.
+#
+# Division by zero (also // and %) is handled per element:
+#   --on-zero nan     NaN in that row (default)
+#   --on-zero mask    the row's result is left empty (NaN in .npy output);
+#                     other NaNs, like sqrt(-1), are still written as nan
+#   --on-zero error   ValueError, like calculator.division
+#
+#   python calculator.py INPUT "x * 2 + y / z" [-o OUT.csv|OUT.npy]
+#   python calculator.py INPUT --op / [-o OUT]      first column / second column
+import argparse
+import csv
+import sys
+import time
+from itertools import islice
+
+import numpy as np
+
+from expression import compile_expression, compile_zero_divisors
+
+CHUNK_ROWS = 100_000
+OPERATIONS = ("+", "-", "*", "/")
+# Options that only batch mode understands; see wants_batch()
+BATCH_OPTIONS = ("--op", "--on-zero", "-o", "--output", "--chunk-rows", "-h", "--help")
+
+
+def _plain_names(n):
+    return [f"c{i}" for i in range(n)]
+
+
+def _csv_header(first):
+    """(column names, whether the first line is a header rather than data)."""
+    cells = next(csv.reader([first]))
+    try:
+        [float(c) for c in cells]
+    except ValueError:
+        return [c.strip() for c in cells], True
+    return _plain_names(len(cells)), False
+
+
+def _csv_chunks(path, chunk_rows):
+    with open(path, newline="") as f:
+        first = f.readline()
+        names, has_header = _csv_header(first)
+        pending = [first] if first.strip() and not has_header else []
+        yield names
+
+        while True:
+            lines = pending + list(islice(f, chunk_rows - len(pending)))
+            pending = []
+            if not lines:
+                break
+            # np.loadtxt parses a whole list of lines in C; blank lines with
+            # stray whitespace trip it up, so those are only dropped on retry
+            try:
+                data = np.loadtxt(lines, delimiter=",", ndmin=2, dtype=float)
+            except ValueError:
+                lines = [line for line in lines if line.strip()]
+                if not lines:
+                    continue
+                data = np.loadtxt(lines, delimiter=",", ndmin=2, dtype=float)
+            if not len(data):
+                continue
+            yield {name: data[:, i] for i, name in enumerate(names)}
+
+
+def _npy_chunks(path, chunk_rows):
+    data = np.load(path, mmap_mode="r")
+    if data.dtype.names:
+        names = list(data.dtype.names)
+    else:
+        names = _plain_names(1 if data.ndim == 1 else data.shape[1])
+    yield names
+
+    for start in range(0, len(data), chunk_rows):
+        block = data[start:start + chunk_rows]
+        if data.dtype.names:
+            yield {name: np.asarray(block[name], dtype=float) for name in names}
+        elif data.ndim == 1:
+            yield {"c0": np.asarray(block, dtype=float)}
+        else:
+            yield {name: np.asarray(block[:, i], dtype=float) for i, name in enumerate(names)}
+
+
+def read_columns(path, chunk_rows=CHUNK_ROWS):
+    """Yield the column names, then one {name: array} dict per chunk."""
+    if path.endswith(".npy"):
+        return _npy_chunks(path, chunk_rows)
+    return _csv_chunks(path, chunk_rows)
+
+
+def count_rows(path):
+    if path.endswith(".npy"):
+        return len(np.load(path, mmap_mode="r"))
+    with open(path, newline="") as f:
+        _, has_header = _csv_header(f.readline())
+        return sum(1 for line in f if line.strip()) + (not has_header)
+
+
+def evaluate_chunks(source, path, on_zero="nan", chunk_rows=CHUNK_ROWS):
+    """Iterator of (result, mask) per chunk; mask marks rows left empty in mask mode.
+
+    The expression and column names are checked before anything is read.
+    """
+    variables = compile_expression(source, vectorized=True).variables
+    chunks = read_columns(path, chunk_rows)
+    names = next(chunks)
+    missing = [name for name in variables if name not in names]
+    if missing:
+        raise ValueError(f"No column named {', '.join(missing)} (columns: {', '.join(names)})")
+    return _evaluate(source, chunks, on_zero)
+
+
+def evaluate_op(op, path, on_zero="nan", chunk_rows=CHUNK_ROWS):
+    """Like evaluate_chunks for first column OP second column.
+
+    The columns are passed by position, so their names do not have to be
+    valid variables (spaces, or names like e and pi are fine).
+    """
+    if op not in OPERATIONS:
+        raise ValueError(f"Unknown operation: {op}")
+    chunks = read_columns(path, chunk_rows)
+    names = next(chunks)
+    if len(names) < 2:
+        raise ValueError(f"--op needs two columns, {path} has {len(names)}")
+    first, second = names[:2]
+    pairs = ({"x": columns[first], "y": columns[second]} for columns in chunks)
+    return _evaluate(f"x {op} y", pairs, on_zero)
+
+
+def _evaluate(source, chunks, on_zero):
+    expr = compile_expression(source, vectorized=True, on_zero="error" if on_zero == "error" else "nan")
+    zero_divisors = compile_zero_divisors(source) if on_zero == "mask" else None
+    row = 0
+    for columns in chunks:
+        n = len(next(iter(columns.values())))
+        try:
+            result = np.broadcast_to(np.asarray(expr.evaluate(columns), dtype=float), (n,))
+        except ValueError as e:
+            raise ValueError(f"{e} (rows {row}..{row + n - 1})") from None
+        mask = None
+        if zero_divisors is not None:
+            mask = np.broadcast_to(zero_divisors.evaluate(columns), (n,))
+        yield result, mask
+        row += n
+
+
+def write_csv(chunks, out):
+    out.write("result\n")
+    for result, mask in chunks:
+        # repr of Python floats is faster than ndarray.astype(str)
+        text = list(map(repr, result.tolist()))
+        if mask is not None:
+            for i in np.flatnonzero(mask).tolist():
+                text[i] = ""
+        out.write("\n".join(text))
+        out.write("\n")
+
+
+def write_npy(chunks, path, rows):
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=float, shape=(rows,))
+    start = 0
+    for result, _ in chunks:
+        out[start:start + len(result)] = result
+        start += len(result)
+    out.flush()
+    del out
+
+
+def wants_batch(argv):
+    """Whether argv is for batch mode: an input file or a batch option.
+
+    Anything else, like no arguments at all, is left to the interactive
+    calculator.
+    """
+    for arg in argv:
+        if not arg.startswith("-"):
+            return True
+        if arg.split("=", 1)[0] in BATCH_OPTIONS or (arg.startswith("-o") and not arg.startswith("--")):
+            return True
+    return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply an operation or expression to whole columns.")
+    parser.add_argument("input", help="CSV (with or without a header) or .npy file")
+    parser.add_argument("expression", nargs="?", help="e.g. 'x * 2 + y / z'")
+    parser.add_argument("--op", choices=OPERATIONS, help="apply to the first two columns instead")
+    parser.add_argument("--on-zero", choices=("nan", "mask", "error"), default="nan")
+    parser.add_argument("-o", "--output", help="CSV or .npy file (default: CSV to stdout)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args(argv)
+
+    if args.op:
+        source = f"first column {args.op} second column"
+    elif args.expression:
+        source = args.expression
+    else:
+        parser.error("give an expression or --op")
+
+    start = time.perf_counter()
+    try:
+        if args.op:
+            chunks = evaluate_op(args.op, args.input, args.on_zero, args.chunk_rows)
+        else:
+            chunks = evaluate_chunks(source, args.input, args.on_zero, args.chunk_rows)
+        if args.output and args.output.endswith(".npy"):
+            write_npy(chunks, args.output, count_rows(args.input))
+        elif args.output:
+            with open(args.output, "w") as out:
+                write_csv(chunks, out)
+        else:
+            write_csv(chunks, sys.stdout)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Error: {e}")
+    print(f"{source}: {time.perf_counter() - start:.2f}s", file=sys.stderr)
@@ -1,23 +1,24 @@
+import sys
 import turtle
 
-t = turtle.Turtle()
-s = turtle.Screen()
-t.speed(0)
-t.penup()
-t.goto(0, 200)
-t.pendown()
-t.pencolor('white')
-s.bgcolor('black')
-a = 0
-b = 0
+import numpy as np
 
-while True:
-    t.forward(a)
-    t.right(b)
-    a+=3
-    b+=1
-    if b == 210:
-        break
-    t.hideturtle()
+from turtle_render import draw, walk
 
-turtle.done()
\ No newline at end of file
+# Seconds per frame when animating (python coronavirus.py --animate)
+FRAME_BUDGET = 1 / 60 if "--animate" in sys.argv else None
+
+
+def coronavirus_points():
+    # forward(a), right(b) with a += 3 and b += 1 until b reaches 210
+    b = np.arange(210)
+    turns = -np.concatenate(([0], b[:-1]))
+    return walk(3 * b, turns, start=(0, 200))
+
+
+if __name__ == "__main__":
+    s = turtle.Screen()
+    s.bgcolor('black')
+    turtle.Turtle().hideturtle()
+    draw(coronavirus_points(), s, color='white', frame_budget=FRAME_BUDGET)
+    turtle.done()
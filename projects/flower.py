@@ -1,17 +1,22 @@
-from tkinter import mainloop
+import sys
 import turtle
 
-from pip import main
-turtle = turtle.Turtle()
-turtle.speed(0)
+import numpy as np
 
-def fleur():
-    for i in range(300):
-        turtle.circle(190-i, 90)
-        turtle.left(90)
-        turtle.circle(190-i, 90)
-        turtle.left(18)
-fleur()
-mainloop()
+from turtle_render import arcs, draw, walk
 
-turtle.done()
\ No newline at end of file
+# Seconds per frame when animating (python flower.py --animate)
+FRAME_BUDGET = 1 / 60 if "--animate" in sys.argv else None
+
+
+def fleur(n=300):
+    # circle(190 - i, 90), left(90), circle(190 - i, 90), left(18) for each i
+    radii = np.repeat(190 - np.arange(n), 2)
+    return walk(*arcs(radii, 90, np.tile([90, 18], n)))
+
+
+if __name__ == "__main__":
+    screen = turtle.Screen()
+    turtle.Turtle().hideturtle()
+    draw(fleur(), screen, frame_budget=FRAME_BUDGET)
+    turtle.done()
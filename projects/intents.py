@@ -0,0 +1,209 @@
+# Question/answer matching for the voice assistant
+#
+# Pairs come from a file with one "question<TAB>answer" per line (# starts
+# a comment). Questions are normalized to lowercase words, with
+# punctuation and extra spaces removed. A match is then resolved like this:
+#
+#   exact   one dict lookup on the normalized question
+#   fuzzy   a character-trigram inverted index; every question sharing a
+#           trigram with the input is counted at once with np.bincount and
+#           scored by the Dice coefficient of the two trigram sets
+#
+# The built index is saved next to the Q&A file and reused while the file
+# is unchanged, so startup does not rebuild it.
+#
+#   python intents.py [N]    build/load/lookup timings for N synthetic questions
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import namedtuple
+
+import numpy as np
+
+Match = namedtuple("Match", "answer question score")
+
+MIN_SCORE = 0.5
+_NON_WORD = re.compile(r"[^\w\s]+")
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKC", text).lower()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def trigrams(normalized):
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def read_pairs(path):
+    pairs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            question, sep, answer = line.partition("\t")
+            if not sep:
+                raise ValueError(f"{path}: expected question<TAB>answer, got {line!r}")
+            pairs.append((question.strip(), answer.strip()))
+    return pairs
+
+
+class IntentIndex:
+    """Exact and trigram lookups over normalized questions.
+
+    The inverted index is stored CSR-style: the question ids for trigram t
+    are postings[offsets[t]:offsets[t + 1]].
+    """
+
+    def __init__(self, questions, answers, grams, offsets, postings, sizes):
+        self.questions = questions
+        self.answers = answers
+        self.exact = {q: i for i, q in enumerate(questions)}
+        self.grams = grams
+        self.gram_ids = {g: i for i, g in enumerate(grams)}
+        self.offsets = offsets
+        self.postings = postings
+        self.sizes = sizes
+
+    def __len__(self):
+        return len(self.questions)
+
+    @classmethod
+    def build(cls, pairs):
+        questions, answers = [], []
+        seen = {}
+        for question, answer in pairs:
+            key = normalize(question)
+            if key in seen:
+                answers[seen[key]] = answer  # later lines win
+                continue
+            seen[key] = len(questions)
+            questions.append(key)
+            answers.append(answer)
+
+        gram_ids, rows, cols = {}, [], []
+        sizes = np.empty(len(questions), dtype=np.int32)
+        for i, question in enumerate(questions):
+            grams = trigrams(question)
+            sizes[i] = len(grams)
+            for g in grams:
+                rows.append(gram_ids.setdefault(g, len(gram_ids)))
+                cols.append(i)
+
+        rows = np.array(rows, dtype=np.int32)
+        order = np.argsort(rows, kind="stable")
+        offsets = np.zeros(len(gram_ids) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(gram_ids)), out=offsets[1:])
+        postings = np.array(cols, dtype=np.int32)[order]
+        return cls(questions, answers, list(gram_ids), offsets, postings, sizes)
+
+    def match(self, text, min_score=MIN_SCORE):
+        """Best Match for text, or None if nothing scores min_score or more."""
+        key = normalize(text)
+        i = self.exact.get(key)
+        if i is not None:
+            return Match(self.answers[i], self.questions[i], 1.0)
+
+        grams = trigrams(key)
+        ids = [self.gram_ids[g] for g in grams if g in self.gram_ids]
+        if not ids:
+            return None
+        # Shared trigram counts for every question at once, then Dice scores;
+        # scoring all of them is cheaper than first finding the nonzero ones
+        hits = np.concatenate([self.postings[self.offsets[g]:self.offsets[g + 1]] for g in ids])
+        shared = np.bincount(hits, minlength=len(self.questions))
+        scores = shared / (len(grams) + self.sizes)
+        i = int(np.argmax(scores))
+        score = 2 * float(scores[i])
+        if score < min_score:
+            return None
+        return Match(self.answers[i], self.questions[i], score)
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "offsets.npy"), self.offsets)
+        np.save(os.path.join(path, "postings.npy"), self.postings)
+        np.save(os.path.join(path, "sizes.npy"), self.sizes)
+        with open(os.path.join(path, "intents.json"), "w", encoding="utf-8") as f:
+            json.dump({"questions": self.questions, "answers": self.answers, "grams": self.grams}, f)
+
+    @classmethod
+    def load(cls, path):
+        with open(os.path.join(path, "intents.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        return cls(meta["questions"], meta["answers"], meta["grams"],
+                   np.load(os.path.join(path, "offsets.npy")),
+                   np.load(os.path.join(path, "postings.npy")),
+                   np.load(os.path.join(path, "sizes.npy")))
+
+
+def load_intents(qna_path, index_path=None):
+    """IntentIndex for a Q&A file, reusing the saved index while the file is unchanged."""
+    index_path = index_path or qna_path + ".index"
+    stamp_path = os.path.join(index_path, "source.json")
+    stat = os.stat(qna_path)
+    stamp = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    try:
+        with open(stamp_path) as f:
+            if json.load(f) == stamp:
+                return IntentIndex.load(index_path)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = IntentIndex.build(read_pairs(qna_path))
+    try:
+        index.save(index_path)
+        with open(stamp_path, "w") as f:
+            json.dump(stamp, f)
+    except OSError:
+        pass  # read-only location: just rebuild next time
+    return index
+
+
+def benchmark(n=10_000, seed=0):
+    rng = random.Random(seed)
+    # A few thousand made-up words, with a handful of very common ones
+    letters = "etaoinshrdlucmfwypvbgk"
+    vocab = list({"".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(5000)})
+    common = ["what", "is", "the", "how", "do", "i", "you", "my"]
+    pairs = [(" ".join(rng.choice(common) if rng.random() < 0.4 else rng.choice(vocab)
+                        for _ in range(rng.randint(3, 8))), f"answer {i}") for i in range(n)]
+    queries = [q for q, _ in rng.sample(pairs, 500)]
+    typos = [q[:len(q) // 2] + q[len(q) // 2 + 1:] for q in queries]
+
+    start = time.perf_counter()
+    index = IntentIndex.build(pairs)
+    build = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as path:
+        index.save(path)
+        start = time.perf_counter()
+        index = IntentIndex.load(path)
+        load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for q in queries:
+        index.match(q)
+    exact = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    matches = [index.match(t) for t in typos]
+    fuzzy = (time.perf_counter() - start) / len(typos)
+    found = sum(m is not None and m.question == normalize(q) for m, q in zip(matches, queries))
+
+    print(f"{n} questions, {len(index.grams)} trigrams")
+    print(f"  build               {build * 1000:>8.1f}ms")
+    print(f"  load saved index    {load * 1000:>8.1f}ms")
+    print(f"  exact match         {exact * 1e6:>8.1f}us")
+    print(f"  fuzzy match         {fuzzy * 1e6:>8.1f}us  ({found}/{len(typos)} typos matched correctly)")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -2,6 +2,12 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import spacy
 import threading
+import queue
+
+from nlp_table_index import ResultIndex
+
+# Rows inserted into the Treeview at once; the index itself holds all results
+DISPLAY_LIMIT = 2000
 
 class NLPApp:
     def __init__(self, root):
@@ -14,6 +20,15 @@ class NLPApp:
         self.nlp = None
         self.doc = None
         self.processed_text = ""
+        self.result_index = None
+        self.sort_column = None
+        self.sort_reverse = False
+        self.view_results = queue.Queue()
+        self.filter_job = None
+        self.pending_views = 0
+        self.view_seq = 0
+        self.applied_seq = 0
+        self.table_seq = 0
         
         # Load spaCy model in background
         self.load_model()
@@ -161,6 +176,31 @@ class NLPApp:
         )
         results_title.pack(fill=tk.X)
         
+        # Filter box
+        filter_frame = tk.Frame(results_frame, bg="white")
+        filter_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        
+        tk.Label(
+            filter_frame,
+            text="Filter:",
+            font=("Arial", 11),
+            bg="white"
+        ).pack(side=tk.LEFT)
+        
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add("write", lambda *args: self.schedule_filter())
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(5, 0))
+        
+        self.view_label = tk.Label(
+            filter_frame,
+            text="",
+            font=("Arial", 9),
+            bg="white",
+            fg="#7f8c8d"
+        )
+        self.view_label.pack(side=tk.LEFT, padx=(10, 0))
+        
         # Results display (Treeview for tables)
         self.results_tree = ttk.Treeview(results_frame, show="headings")
         self.results_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -231,6 +271,9 @@ class NLPApp:
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
         self.results_tree["columns"] = ()
+        self.result_index = None
+        self.table_seq = 0
+        self.view_label.config(text="")
         
         # Hide text display
         self.results_text.pack_forget()
@@ -240,15 +283,96 @@ class NLPApp:
         """Display data in table format."""
         self.clear_results()
         
-        # Configure columns
+        # Configure columns; clicking a heading sorts by it
         self.results_tree["columns"] = columns
         for col in columns:
-            self.results_tree.heading(col, text=col)
+            self.results_tree.heading(col, text=col, command=lambda c=col: self.sort_by(c))
             self.results_tree.column(col, anchor=tk.W, width=150)
         
-        # Add data
-        for row in data:
-            self.results_tree.insert("", tk.END, values=row)
+        # Index the rows once, in the background like every view, then
+        # display them through the current filter
+        self.sort_column = None
+        self.sort_reverse = False
+        self.view_seq += 1
+        self.table_seq = seq = self.view_seq
+        query = self.filter_var.get()
+        self.view_label.config(text=f"Indexing {len(data)} rows...")
+        
+        def build():
+            index = ResultIndex(columns, data)
+            self.view_results.put((seq, index, index.view(query), query))
+        
+        self.start_view(build)
+    
+    def sort_by(self, column):
+        """Sort by a column; clicking it again reverses the order."""
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.refresh_view()
+    
+    def schedule_filter(self):
+        """Debounce typing so a burst of keystrokes runs one filter."""
+        if self.filter_job is not None:
+            self.root.after_cancel(self.filter_job)
+        self.filter_job = self.root.after(50, self.refresh_view)
+    
+    def refresh_view(self):
+        """Filter and sort in a background thread; the result comes back through a queue."""
+        self.filter_job = None
+        index = self.result_index
+        if index is None:
+            return  # still indexing; the finished index is shown with the current filter
+        query = self.filter_var.get()
+        sort_column, reverse = self.sort_column, self.sort_reverse
+        self.view_seq += 1
+        seq = self.view_seq
+        
+        def compute():
+            self.view_results.put((seq, index, index.view(query, sort_column, reverse), query))
+        
+        self.start_view(compute)
+    
+    def start_view(self, compute):
+        threading.Thread(target=compute, daemon=True).start()
+        self.pending_views += 1
+        if self.pending_views == 1:
+            self.root.after(10, self.poll_view)
+    
+    def poll_view(self):
+        """Apply the newest finished view on the Tk thread."""
+        latest = None
+        while True:
+            try:
+                result = self.view_results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending_views -= 1
+            if latest is None or result[0] > latest[0]:
+                latest = result
+        if self.pending_views > 0:
+            self.root.after(10, self.poll_view)
+        if latest is None or latest[0] < self.applied_seq:
+            return
+        
+        seq, index, row_ids, query = latest
+        self.applied_seq = seq
+        installed = index is not self.result_index
+        if installed:
+            if seq != self.table_seq:
+                return  # a newer analysis replaced the table meanwhile
+            self.result_index = index
+        
+        self.results_tree.delete(*self.results_tree.get_children())
+        for i in row_ids[:DISPLAY_LIMIT]:
+            self.results_tree.insert("", tk.END, values=index.rows[i])
+        
+        shown = min(len(row_ids), DISPLAY_LIMIT)
+        self.view_label.config(text=f"{shown} of {len(row_ids)} matches ({len(index)} rows)")
+        if installed and (query != self.filter_var.get() or self.sort_column is not None):
+            self.refresh_view()  # the filter or sort changed while indexing
     
     def show_text(self, text):
         """Display text results."""
@@ -0,0 +1,357 @@
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import queue
+import random
+import signal
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import spacy
+
+import nlp_spacy_program as program
+
+# Menu operations of nlp_spacy_program.py, driven exactly as the program does
+OPERATIONS = {
+    "tokenization": program.tokenization,
+    "annotation": program.linguistical_annotation,
+    "lemmatization": program.lemmatization,
+    "sentences": program.sentence_detection,
+    "pos": program.pos_tagging,
+    "ner": program.ner,
+    "stopwords": program.remove_stop_words,
+    "dependency": program.dependency_parsing,
+}
+
+WORDS = (
+    "the quick brown fox jumps over the lazy dog while Apple opens a new office in London "
+    "and researchers at Stanford University publish results about language models on Monday "
+    "because prices rose by 5 percent in Germany last year"
+).split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator for the spaCy analysis path.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="generate load and report latency")
+    run.add_argument("--target", default="inproc",
+                     help="'inproc' (local worker processes) or host:port of a running 'serve'")
+    run.add_argument("--operation", default="annotation", choices=sorted(OPERATIONS))
+    run.add_argument("--concurrency", type=int, default=4,
+                     help="open connections, or inproc worker processes (one model each)")
+    run.add_argument("--rate", type=float, default=None,
+                     help="open-loop arrival rate in requests/sec (default: closed loop)")
+    run.add_argument("--requests", type=int, default=500, help="total requests to send")
+    run.add_argument("--warmup", type=int, default=20, help="requests excluded from the statistics")
+    run.add_argument("--size", default="lognormal:200",
+                     help="document size in words: fixed:N, uniform:A-B or lognormal:MEDIAN")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--json", action="store_true", help="print the report as JSON")
+
+    serve = sub.add_parser("serve", help="run a local stand-in analysis server")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--workers", type=int, default=os.cpu_count(), help="analysis processes (one model each)")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        run_server(args.port, args.workers)
+    else:
+        report = run_load(args)
+        print_report(report, args.json)
+
+
+def size_sampler(spec, rng):
+    kind, _, value = spec.partition(":")
+    if kind == "fixed":
+        n = int(value)
+        return lambda: n
+    if kind == "uniform":
+        low, high = map(int, value.split("-"))
+        return lambda: rng.randint(low, high)
+    if kind == "lognormal":
+        median = float(value)
+        return lambda: max(1, int(rng.lognormvariate(0, 0.75) * median))
+    raise ValueError(f"Unknown size distribution: {spec}")
+
+
+def make_documents(n, spec, seed):
+    rng = random.Random(seed)
+    sample_size = size_sampler(spec, rng)
+    docs = []
+    for _ in range(n):
+        words = [rng.choice(WORDS) for _ in range(sample_size())]
+        # Break into sentences so the parser sees realistic input
+        for i in range(12, len(words), 12):
+            words[i - 1] += "."
+        docs.append(" ".join(words) + ".")
+    return docs
+
+
+class AnalysisWorkers:
+    """Worker processes that each load their own model.
+
+    The analysis is CPU-bound and holds the GIL, so threads sharing one
+    model only ever use one core. Every call here goes to an idle process
+    instead, which lets the measured concurrency use as many cores as there
+    are workers. All models are loaded before the constructor returns.
+    """
+
+    def __init__(self, n):
+        self._free = queue.Queue()
+        self._processes = []
+        for _ in range(n):
+            conn, child_conn = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=analysis_worker, args=(child_conn,), daemon=True)
+            process.start()
+            child_conn.close()
+            self._processes.append((process, conn))
+        for _, conn in self._processes:
+            conn.recv()  # the model is loaded
+            self._free.put(conn)
+
+    def analyze(self, operation, text):
+        conn = self._free.get()
+        try:
+            conn.send((operation, text))
+            error = conn.recv()
+        finally:
+            self._free.put(conn)
+        if error:
+            raise RuntimeError(error)
+
+    def close(self):
+        for process, conn in self._processes:
+            try:
+                conn.send(None)
+            except OSError:
+                pass  # already gone
+            process.join()
+
+
+def analysis_worker(conn):
+    # Ctrl+C is handled by the parent, which shuts the workers down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    nlp = spacy.load("en_core_web_sm")
+    # The analysis functions print their tables; discard that
+    sys.stdout = open(os.devnull, "w")
+    conn.send(None)
+    while True:
+        job = conn.recv()
+        if job is None:
+            return
+        operation, text = job
+        try:
+            OPERATIONS[operation](nlp(text))
+            conn.send(None)
+        except Exception as e:
+            conn.send(repr(e))
+
+
+def http_client(target, operation):
+    host, _, port = target.partition(":")
+    local = threading.local()
+
+    def send(text):
+        if not hasattr(local, "conn"):
+            local.conn = http.client.HTTPConnection(host, int(port or 80))
+        body = json.dumps({"text": text, "operation": operation})
+        local.conn.request("POST", "/analyze", body, {"Content-Type": "application/json"})
+        response = local.conn.getresponse()
+        response.read()
+        if response.status != 200:
+            raise RuntimeError(f"HTTP {response.status}")
+
+    return send
+
+
+def run_load(args):
+    docs = make_documents(args.requests, args.size, args.seed)
+    workers = None
+    if args.target == "inproc":
+        workers = AnalysisWorkers(args.concurrency)
+        send = lambda text: workers.analyze(args.operation, text)
+    else:
+        send = http_client(args.target, args.operation)
+
+    jobs = queue.Queue()
+    latencies = [None] * len(docs)
+    errors = []
+
+    def worker():
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            i, scheduled = job
+            # Open loop measures from the scheduled arrival, so queueing delay
+            # behind slow requests counts (no coordinated omission)
+            start = scheduled if scheduled is not None else time.perf_counter()
+            try:
+                send(docs[i])
+                latencies[i] = time.perf_counter() - start
+            except Exception as e:
+                errors.append(repr(e))
+
+    try:
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(args.concurrency)]
+        for t in threads:
+            t.start()
+
+        cpu_before = read_cpu_times()
+        started = time.perf_counter()
+        if args.rate:
+            rng = random.Random(args.seed + 1)
+            next_arrival = started
+            for i in range(len(docs)):
+                next_arrival += rng.expovariate(args.rate)
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                jobs.put((i, next_arrival))
+        else:
+            for i in range(len(docs)):
+                jobs.put((i, None))
+        for _ in threads:
+            jobs.put(None)
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - started
+        cpu_after = read_cpu_times()
+    finally:
+        if workers:
+            workers.close()
+
+    measured = sorted(lat for lat in latencies[args.warmup:] if lat is not None)
+    # Throughput counts completed requests only; a failing target is not fast
+    completed = [doc for doc, lat in zip(docs, latencies) if lat is not None]
+    words = sum(len(d.split()) for d in completed)
+    return {
+        "target": args.target,
+        "operation": args.operation,
+        "mode": f"open loop @ {args.rate:g} req/s" if args.rate else "closed loop",
+        "concurrency": args.concurrency,
+        "requests": len(docs),
+        "errors": len(errors),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(completed) / elapsed,
+        "throughput_words_s": words / elapsed,
+        "latency_ms": {
+            "mean": 1000 * sum(measured) / len(measured) if measured else None,
+            "p50": percentile_ms(measured, 50),
+            "p95": percentile_ms(measured, 95),
+            "p99": percentile_ms(measured, 99),
+            "max": 1000 * measured[-1] if measured else None,
+            "samples": len(measured),
+        },
+        "cpu_percent_per_core": cpu_utilisation(cpu_before, cpu_after),
+    }
+
+
+def percentile_ms(sorted_values, p):
+    """p-th percentile in milliseconds, or None without samples."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(sorted_values) - 1)
+    return 1000 * (sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low))
+
+
+def read_cpu_times():
+    """Per-core (busy, total) jiffies from /proc/stat; empty off Linux."""
+    try:
+        with open("/proc/stat") as f:
+            lines = f.readlines()
+    except OSError:
+        return {}
+    times = {}
+    for line in lines:
+        name, *fields = line.split()
+        if name.startswith("cpu") and name != "cpu":
+            values = list(map(int, fields))
+            idle = values[3] + (values[4] if len(values) > 4 else 0)
+            times[name] = (sum(values) - idle, sum(values))
+    return times
+
+
+def cpu_utilisation(before, after):
+    usage = {}
+    for core, (busy, total) in after.items():
+        busy0, total0 = before.get(core, (0, 0))
+        usage[core] = round(100 * (busy - busy0) / (total - total0), 1) if total > total0 else 0.0
+    return usage
+
+
+def print_report(report, as_json):
+    if as_json:
+        print(json.dumps(report, indent=2))
+        return
+
+    lat = report["latency_ms"]
+    dash()
+    print(f"Target: {report['target']}  Operation: {report['operation']}  Mode: {report['mode']}")
+    print(f"Concurrency: {report['concurrency']}  Requests: {report['requests']}  Errors: {report['errors']}")
+    dash()
+    print(f"Throughput: {report['throughput_rps']:.1f} req/s, {report['throughput_words_s']:.0f} words/s")
+    if lat["samples"]:
+        print(f"Latency (ms): p50 {lat['p50']:.1f}  p95 {lat['p95']:.1f}  p99 {lat['p99']:.1f}  max {lat['max']:.1f}")
+    else:
+        print("Latency (ms): no successful requests after warmup")
+    if report["cpu_percent_per_core"]:
+        cores = "  ".join(f"{core}: {pct:.0f}%" for core, pct in report["cpu_percent_per_core"].items())
+        print(f"CPU per core: {cores}")
+    dash()
+
+
+def run_server(port, workers):
+    analysis = AnalysisWorkers(workers)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            if self.path != "/analyze":
+                self.send_error(404)
+                return
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if payload.get("operation") not in OPERATIONS:
+                self.send_error(400, "Unknown operation")
+                return
+            try:
+                analysis.analyze(payload["operation"], payload["text"])
+            except RuntimeError as e:
+                self.send_error(500, str(e))
+                return
+            body = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    dash()
+    print(f"Stand-in analysis server on http://127.0.0.1:{port}/analyze "
+          f"with {workers} worker processes (Ctrl+C to stop)")
+    dash()
+    try:
+        ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+    except KeyboardInterrupt:
+        print("Server stopped.")
+    finally:
+        analysis.close()
+
+
+def dash():
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
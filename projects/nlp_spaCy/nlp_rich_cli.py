@@ -1,11 +1,36 @@
+import re
+import sys
+import time
+
 import spacy
+from spacy.tokens import Doc
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
-from rich.prompt import Prompt
+from rich.prompt import Prompt, Confirm
+from rich.text import Text
 
 console = Console()
 
+OPERATIONS_TEXT = """[bold cyan]Choose an operation:[/bold cyan]
+
+  💬 [bold white]1[/bold white]. Tokenization
+  📝 [bold white]2[/bold white]. Linguistic Annotation
+  🔤 [bold white]3[/bold white]. Lemmatization
+  📄 [bold white]4[/bold white]. Sentence Detection
+  🏷️  [bold white]5[/bold white]. POS Tagging
+  🎯 [bold white]6[/bold white]. Named Entity Recognition
+  🚫 [bold white]7[/bold white]. Stop Words Removal
+  🔗 [bold white]8[/bold white]. Dependency Parsing"""
+
+MENU_TEXT = OPERATIONS_TEXT + """
+  🔄 [bold white]9[/bold white]. Analyze New Text
+  👋 [bold white]0[/bold white]. Exit"""
+
+# Inputs with at least this many paragraphs are offered progressive streaming
+PROGRESSIVE_MIN_PARAGRAPHS = 3
+
 def main():
     # Welcome header
     console.print(Panel.fit(
@@ -20,10 +45,15 @@ def main():
     
     console.print("[green]✓[/green] Model loaded successfully!\n")
     
+    # A file given on the command line is analyzed first, blank lines and all
+    pending = read_file(sys.argv[1]) if len(sys.argv) > 1 else None
     while True:
-        text = Prompt.ask("[bold yellow]Enter text to analyze[/bold yellow] (or 'quit' to exit)")
+        if pending is not None:
+            text, pending = pending, None
+        else:
+            text = read_text()
         
-        if text.lower() == 'quit':
+        if text is None or text.strip().lower() == 'quit':
             console.print(Panel("[cyan]Thank you for using the program. Goodbye![/cyan]", border_style="cyan"))
             break
             
@@ -32,8 +62,15 @@ def main():
             continue
         
         # Process text
-        with console.status("[bold green]Processing text...", spinner="dots"):
-            doc = nlp(text)
+        paragraphs = split_paragraphs(text)
+        if len(paragraphs) >= PROGRESSIVE_MIN_PARAGRAPHS and Confirm.ask(
+            f"[bold yellow]Stream results for {len(paragraphs)} paragraphs as they are processed?[/bold yellow]",
+            default=True
+        ):
+            doc = progressive_analysis(nlp, paragraphs)
+        else:
+            with console.status("[bold green]Processing text...", spinner="dots"):
+                doc = nlp(text)
         
         # Show what was processed
         console.print(Panel(
@@ -45,52 +82,37 @@ def main():
         # Operations menu loop
         operations_menu(doc)
 
+def read_file(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+def read_text():
+    """Lines up to an empty line, so a pasted document is read whole
+    instead of spilling into the prompts after it. None at end of input."""
+    console.print("[bold yellow]Enter text to analyze[/bold yellow] "
+                  "(end with an empty line, or 'quit' to exit)")
+    lines = []
+    while True:
+        try:
+            line = console.input()
+        except EOFError:
+            return "\n".join(lines) if lines else None
+        if not line.strip():
+            return "\n".join(lines)
+        lines.append(line)
+
 def operations_menu(doc):
     while True:
         console.print()
         
-        # Create menu panel
-        menu_text = """[bold cyan]Choose an operation:[/bold cyan]
-
-  💬 [bold white]1[/bold white]. Tokenization
-  📝 [bold white]2[/bold white]. Linguistic Annotation
-  🔤 [bold white]3[/bold white]. Lemmatization
-  📄 [bold white]4[/bold white]. Sentence Detection
-  🏷️  [bold white]5[/bold white]. POS Tagging
-  🎯 [bold white]6[/bold white]. Named Entity Recognition
-  🚫 [bold white]7[/bold white]. Stop Words Removal
-  🔗 [bold white]8[/bold white]. Dependency Parsing
-  🔄 [bold white]9[/bold white]. Analyze New Text
-  👋 [bold white]0[/bold white]. Exit"""
-        
-        console.print(Panel(menu_text, border_style="cyan"))
+        console.print(Panel(MENU_TEXT, border_style="cyan"))
         
         user_input = Prompt.ask("[bold yellow]Option[/bold yellow]").strip()
         
-        if user_input == "1":
-            console.print(Panel("[bold green]Tokenization[/bold green]", border_style="green"))
-            tokenization(doc)
-        elif user_input == "2":
-            console.print(Panel("[bold green]Linguistic Annotations[/bold green]", border_style="green"))
-            linguistical_annotation(doc)
-        elif user_input == "3":
-            console.print(Panel("[bold green]Lemmatization[/bold green]", border_style="green"))
-            lemmatization(doc)
-        elif user_input == "4":
-            console.print(Panel("[bold green]Sentence Detection[/bold green]", border_style="green"))
-            sentence_detection(doc)
-        elif user_input == "5":
-            console.print(Panel("[bold green]POS Tagging[/bold green]", border_style="green"))
-            pos_tagging(doc)
-        elif user_input == "6":
-            console.print(Panel("[bold green]Named Entity Recognition[/bold green]", border_style="green"))
-            ner(doc)
-        elif user_input == "7":
-            console.print(Panel("[bold green]Stop Words Removal[/bold green]", border_style="green"))
-            remove_stop_words(doc)
-        elif user_input == "8":
-            console.print(Panel("[bold green]Dependency Parsing[/bold green]", border_style="green"))
-            dependency_parsing(doc)
+        if user_input in OPERATIONS:
+            title, operation = OPERATIONS[user_input]
+            console.print(Panel(f"[bold green]{title}[/bold green]", border_style="green"))
+            operation(doc)
         elif user_input == "9":
             return  # Go back to text input
         elif user_input == "0":
@@ -99,12 +121,53 @@ def operations_menu(doc):
         else:
             console.print(Panel("[red]❌ Invalid input! Please try again.[/red]", border_style="red"))
 
-def tokenization(doc):
+def split_paragraphs(text):
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", text) if p.strip()]
+    if len(paragraphs) < PROGRESSIVE_MIN_PARAGRAPHS:
+        # Pasted text often has single newlines only; fall back to lines
+        paragraphs = [line.strip() for line in text.splitlines() if line.strip()]
+    return paragraphs
+
+def progressive_analysis(nlp, paragraphs):
+    console.print(Panel(OPERATIONS_TEXT, border_style="cyan"))
+    option = Prompt.ask("[bold yellow]Option to stream[/bold yellow]", choices=list(OPERATIONS), default="1")
+    title, operation = OPERATIONS[option]
+    console.print(Panel(f"[bold green]{title}[/bold green]", border_style="green"))
+
+    # Only the meter is live; each paragraph's table is printed above it once
+    # and never redrawn, so rendering stays linear in the size of the input
+    meter = Text()
+    docs = []
+    n_tokens = 0
+    n_sents = 0
+    started = time.perf_counter()
+    with Live(meter, console=console, refresh_per_second=8):
+        for doc in nlp.pipe(paragraphs, batch_size=4):
+            docs.append(doc)
+            if option == "1":
+                operation(doc, start=n_tokens)
+            elif option == "4":
+                operation(doc, start=n_sents)
+            else:
+                operation(doc)
+
+            n_tokens += len(doc)
+            n_sents += sum(1 for _ in doc.sents)
+            elapsed = time.perf_counter() - started
+            meter.plain = (
+                f"⏱ {len(docs)}/{len(paragraphs)} paragraphs · {n_tokens} tokens · "
+                f"{n_tokens / elapsed if elapsed else 0:,.0f} tokens/sec"
+            )
+
+    # Stitch the chunks back together so the regular menu works on the whole text
+    return Doc.from_docs(docs)
+
+def tokenization(doc, start=0):
     table = Table(show_header=True, header_style="bold magenta", border_style="blue")
     table.add_column("Token #", style="cyan", justify="right")
     table.add_column("Token", style="yellow")
     
-    for index, token in enumerate(doc, start=1):
+    for index, token in enumerate(doc, start=start + 1):
         table.add_row(str(index), token.text)
     
     console.print(table)
@@ -138,12 +201,12 @@ def lemmatization(doc):
     
     console.print(table)
 
-def sentence_detection(doc):
+def sentence_detection(doc, start=0):
     table = Table(show_header=True, header_style="bold magenta", border_style="blue")
     table.add_column("Sentence #", style="cyan", justify="right")
     table.add_column("Sentence", style="yellow")
     
-    for index, sent in enumerate(doc.sents, start=1):
+    for index, sent in enumerate(doc.sents, start=start + 1):
         table.add_row(str(index), sent.text)
     
     console.print(table)
@@ -210,5 +273,17 @@ def dependency_parsing(doc):
     
     console.print(table)
 
+# Menu option -> (title, function printing that operation's result for a doc)
+OPERATIONS = {
+    "1": ("Tokenization", tokenization),
+    "2": ("Linguistic Annotations", linguistical_annotation),
+    "3": ("Lemmatization", lemmatization),
+    "4": ("Sentence Detection", sentence_detection),
+    "5": ("POS Tagging", pos_tagging),
+    "6": ("Named Entity Recognition", ner),
+    "7": ("Stop Words Removal", remove_stop_words),
+    "8": ("Dependency Parsing", dependency_parsing),
+}
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
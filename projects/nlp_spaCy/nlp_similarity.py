@@ -0,0 +1,273 @@
+import json
+import os
+import sys
+
+import numpy as np
+import spacy
+
+
+def main():
+    nlp = spacy.load("en_core_web_sm")
+    header()
+
+    if len(sys.argv) > 1 and os.path.isdir(sys.argv[1]):
+        index, sentences = load_index(sys.argv[1])
+        print(f"Loaded index with {len(sentences)} sentences from {sys.argv[1]}")
+    else:
+        text = read_corpus(sys.argv[1] if len(sys.argv) > 1 else None)
+        if not text:
+            print("Error: Please enter some text.")
+            dash()
+            return
+        sentences = split_sentences(text)
+        index = build_index(embed_texts(nlp, sentences))
+        print(f"Indexed {len(sentences)} sentences ({index.__class__.__name__})")
+        if len(sys.argv) > 2:
+            save_index(sys.argv[2], index, sentences)
+            print(f"Saved index to {sys.argv[2]}")
+    dash()
+
+    query_loop(nlp, index, sentences)
+
+
+def header():
+    dash()
+    print("Sentence Similarity Search - powered by spaCy vectors")
+    dash()
+
+
+def read_corpus(path):
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return f.read().strip()
+    return input("Enter text to index:\n").strip()
+
+
+def query_loop(nlp, index, sentences, k=5):
+    while True:
+        query = input("Enter a query sentence (or 'quit' to exit):\n").strip()
+        if query.lower() == "quit":
+            dash()
+            print("Thank you for using the program. Goodbye!")
+            dash()
+            break
+        if not query:
+            print("Error: Please enter some text.")
+            dash()
+            continue
+
+        ids, scores = index.search(embed_text(nlp, query), k)
+        dash()
+        for rank, (i, score) in enumerate(zip(ids, scores), start=1):
+            print(f"{rank}. ({score:.3f}) {sentences[i]}")
+        dash()
+
+
+def split_sentences(text, chunk_size=100_000):
+    """Sentences of a corpus of any size.
+
+    A single nlp(text) call is capped at nlp.max_length characters, so the
+    text is split by a rule-based sentencizer, fed in line-aligned chunks.
+    """
+    splitter = spacy.blank("en")
+    splitter.add_pipe("sentencizer")
+    sentences = []
+    for doc in splitter.pipe(_chunks(text, chunk_size)):
+        sentences.extend(sent.text.strip() for sent in doc.sents if sent.text.strip())
+    return sentences
+
+
+def _chunks(text, size):
+    start = 0
+    while start < len(text):
+        end = start + size
+        if end < len(text):
+            # Cut at a line break, or at least a space, so no sentence is split
+            cut = text.rfind("\n", start, end)
+            if cut <= start:
+                cut = text.rfind(" ", start, end)
+            end = cut + 1 if cut > start else end
+        yield text[start:end]
+        start = end
+
+
+def vector_pipes(nlp):
+    """Pipeline components doc.vector depends on.
+
+    With static word vectors none are needed. Otherwise doc.vector is the
+    mean of doc.tensor, which only the tok2vec (or transformer) layer sets;
+    the tagger, parser, NER and lemmatizer are wasted work here.
+    """
+    if nlp.vocab.vectors.size:
+        return []
+    return [name for name in nlp.pipe_names if name in ("tok2vec", "transformer")]
+
+
+def embed_texts(nlp, texts, batch_size=256):
+    """Embed many short texts (already split into sentences) through nlp.pipe."""
+    vectors = None
+    with nlp.select_pipes(enable=vector_pipes(nlp)):
+        for row, doc in enumerate(nlp.pipe(texts, batch_size=batch_size)):
+            if vectors is None:
+                vectors = np.empty((len(texts), doc.vector.shape[0]), dtype=np.float32)
+            vectors[row] = doc.vector
+    if vectors is None:
+        return np.empty((0, 0), dtype=np.float32)
+    return normalize(vectors)
+
+
+def embed_text(nlp, text):
+    with nlp.select_pipes(enable=vector_pipes(nlp)):
+        doc = nlp(text)
+    return normalize(doc.vector.astype(np.float32)[None, :])[0]
+
+
+def normalize(vectors):
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    vectors /= norms
+    return vectors
+
+
+def top_k(scores, k):
+    """Indices of the k largest scores, best first, without a full sort."""
+    k = min(k, scores.shape[0])
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part])]
+
+
+class BruteForceIndex:
+    """Exact search: one matrix-vector product over all sentence vectors."""
+
+    def __init__(self, vectors):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def __len__(self):
+        return self.vectors.shape[0]
+
+    def search(self, query, k=5):
+        scores = self.vectors @ query
+        best = top_k(scores, k)
+        return best, scores[best]
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, "vectors.npy"), self.vectors)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r"):
+        return cls(np.load(os.path.join(path, "vectors.npy"), mmap_mode=mmap_mode))
+
+
+class IVFIndex:
+    """Approximate search over k-means partitions (inverted file).
+
+    Vectors are stored sorted by partition so every list is one contiguous
+    slice of the matrix; a query scores the centroids, then only the
+    `nprobe` closest lists.
+    """
+
+    def __init__(self, centroids, vectors, ids, offsets, nprobe=8):
+        self.centroids = centroids
+        self.vectors = vectors
+        self.ids = ids
+        self.offsets = offsets
+        self.nprobe = nprobe
+
+    def __len__(self):
+        return self.vectors.shape[0]
+
+    @classmethod
+    def build(cls, vectors, n_lists=None, n_iter=10, sample_size=65536, nprobe=8, seed=0):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        n = vectors.shape[0]
+        if n_lists is None:
+            n_lists = max(1, int(np.sqrt(n)))
+        n_lists = min(n_lists, n)
+        rng = np.random.default_rng(seed)
+
+        sample = vectors[rng.choice(n, min(n, sample_size), replace=False)]
+        centroids = sample[rng.choice(sample.shape[0], n_lists, replace=False)].copy()
+        for _ in range(n_iter):
+            assign = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(n_lists):
+                members = sample[assign == c]
+                if len(members):
+                    centroids[c] = members.mean(axis=0)
+            normalize(centroids)
+
+        assign = np.empty(n, dtype=np.int32)
+        for start in range(0, n, sample_size):
+            block = vectors[start:start + sample_size]
+            assign[start:start + sample_size] = np.argmax(block @ centroids.T, axis=1)
+
+        order = np.argsort(assign, kind="stable")
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(assign, minlength=n_lists), out=offsets[1:])
+        return cls(centroids, vectors[order], order.astype(np.int64), offsets, nprobe)
+
+    def search(self, query, k=5):
+        lists = top_k(self.centroids @ query, self.nprobe)
+        candidates = [np.arange(self.offsets[c], self.offsets[c + 1]) for c in lists]
+        rows = np.concatenate(candidates) if candidates else np.empty(0, dtype=np.int64)
+        scores = self.vectors[rows] @ query
+        best = top_k(scores, k)
+        return self.ids[rows[best]], scores[best]
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "ivf.json"), "w") as f:
+            json.dump({"nprobe": self.nprobe}, f)
+        np.save(os.path.join(path, "centroids.npy"), self.centroids)
+        np.save(os.path.join(path, "vectors.npy"), self.vectors)
+        np.save(os.path.join(path, "ids.npy"), self.ids)
+        np.save(os.path.join(path, "offsets.npy"), self.offsets)
+
+    @classmethod
+    def load(cls, path, mmap_mode="r", nprobe=None):
+        """nprobe defaults to the value the index was saved with."""
+        if nprobe is None:
+            with open(os.path.join(path, "ivf.json")) as f:
+                nprobe = json.load(f)["nprobe"]
+        return cls(
+            np.load(os.path.join(path, "centroids.npy")),
+            np.load(os.path.join(path, "vectors.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, "ids.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(path, "offsets.npy")),
+            nprobe,
+        )
+
+
+def build_index(vectors, approximate=None):
+    """Brute force for small corpora, IVF once a full scan stops being cheap."""
+    if approximate is None:
+        approximate = vectors.shape[0] > 100_000
+    if approximate:
+        return IVFIndex.build(vectors)
+    return BruteForceIndex(vectors)
+
+
+def save_index(path, index, sentences):
+    index.save(path)
+    with open(os.path.join(path, "sentences.json"), "w", encoding="utf-8") as f:
+        json.dump({"kind": index.__class__.__name__, "sentences": sentences}, f)
+
+
+def load_index(path, mmap_mode="r"):
+    with open(os.path.join(path, "sentences.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta["kind"] == "IVFIndex":
+        index = IVFIndex.load(path, mmap_mode)
+    else:
+        index = BruteForceIndex.load(path, mmap_mode)
+    return index, meta["sentences"]
+
+
+def dash():
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
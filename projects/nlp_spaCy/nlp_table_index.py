@@ -0,0 +1,97 @@
+import threading
+
+
+class ResultIndex:
+    """Precomputed search and sort structures over one result table.
+
+    Built once per analysis, so filtering and re-sorting never touch the
+    spaCy doc again:
+
+    - a lowercase copy of every row for substring search,
+    - per column, a value -> row ids index for `column:value` queries,
+    - per column, a sort order computed on first use and then cached.
+
+    Queries are whitespace-separated terms that must all match. A term of
+    the form `column:value` (e.g. `pos:propn`) matches that column exactly,
+    case-insensitively; any other term is a substring match on the row.
+    """
+
+    def __init__(self, columns, rows):
+        self.columns = tuple(columns)
+        self.rows = rows
+        self._column_ids = {name.lower().replace(" ", ""): i for i, name in enumerate(self.columns)}
+        self._haystack = ["\t".join(row).lower() for row in rows]
+        self._values = [{} for _ in self.columns]
+        for row_id, row in enumerate(rows):
+            for col, value in enumerate(row):
+                self._values[col].setdefault(value.lower(), []).append(row_id)
+        self._orders = {}
+        self._last_query = None
+        self._last_matches = None
+        # The UIs query from worker threads; the caches above are shared
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def filter(self, query):
+        """Row ids matching `query`, in original order."""
+        query = query.strip().lower()
+        if not query:
+            return range(len(self.rows))
+
+        # Typing usually extends the previous query; for substring terms that
+        # can only narrow the matches, so only the previous result is rescanned
+        if self._last_query and query.startswith(self._last_query) and ":" not in query:
+            candidates = self._last_matches
+        else:
+            candidates = None
+
+        for term in query.split():
+            column, sep, value = term.partition(":")
+            if sep and column in self._column_ids:
+                ids = self._values[self._column_ids[column]].get(value, ())
+                if candidates is None:
+                    candidates = list(ids)
+                else:
+                    allowed = set(ids)
+                    candidates = [i for i in candidates if i in allowed]
+            else:
+                haystack = self._haystack
+                if candidates is None:
+                    candidates = [i for i, text in enumerate(haystack) if term in text]
+                else:
+                    candidates = [i for i in candidates if term in haystack[i]]
+
+        self._last_query = query
+        self._last_matches = candidates
+        return candidates
+
+    def order(self, column, reverse=False):
+        """Row ids sorted by `column`; numeric columns sort numerically."""
+        key = (column, reverse)
+        if key not in self._orders:
+            col = self.columns.index(column)
+            values = [row[col] for row in self.rows]
+            if all(v.lstrip("-").isdigit() for v in values):
+                sort_keys = [int(v) for v in values]
+            else:
+                sort_keys = [v.lower() for v in values]
+            self._orders[key] = sorted(range(len(values)), key=sort_keys.__getitem__, reverse=reverse)
+        return self._orders[key]
+
+    def view(self, query="", sort_column=None, reverse=False):
+        """Row ids matching `query`, in the requested sort order."""
+        with self._lock:
+            return self._view(query, sort_column, reverse)
+
+    def _view(self, query, sort_column, reverse):
+        matches = self.filter(query)
+        if sort_column is None:
+            return list(matches)
+        if len(matches) == len(self.rows):
+            return self.order(sort_column, reverse)
+        wanted = bytearray(len(self.rows))
+        for i in matches:
+            wanted[i] = 1
+        return [i for i in self.order(sort_column, reverse) if wanted[i]]
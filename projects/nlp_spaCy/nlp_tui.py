@@ -1,9 +1,16 @@
 import spacy
+from textual import work
+from textual.worker import get_current_worker
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
-from textual.widgets import Header, Footer, Static, Button, TextArea, Label, DataTable
+from textual.widgets import Header, Footer, Static, Button, TextArea, Label, DataTable, Input
 from textual.binding import Binding
 
+from nlp_table_index import ResultIndex
+
+# Rows pushed into the DataTable at once; the index itself holds all results
+DISPLAY_LIMIT = 2000
+
 class NLPApp(App):
     """A Textual app for NLP operations using spaCy."""
     
@@ -60,11 +67,16 @@ class NLPApp(App):
     DataTable {
         height: 100%;
     }
+    
+    #filter-input {
+        margin-bottom: 1;
+    }
     """
     
     BINDINGS = [
         Binding("q", "quit", "Quit", show=True),
         Binding("c", "clear", "Clear", show=True),
+        Binding("ctrl+f", "focus_filter", "Filter", show=True),
     ]
     
     def __init__(self):
@@ -72,6 +84,13 @@ class NLPApp(App):
         self.nlp = None
         self.doc = None
         self.processed_text = ""
+        self.result_index = None
+        self.sort_column = None
+        self.sort_reverse = False
+        # Views are numbered so a slow, stale one never replaces a newer one
+        self.view_seq = 0
+        self.applied_seq = 0
+        self.table_seq = 0
     
     def compose(self) -> ComposeResult:
         """Create child widgets for the app."""
@@ -100,6 +119,7 @@ class NLPApp(App):
                 
                 # Results area
                 with ScrollableContainer(id="results"):
+                    yield Input(placeholder="Filter rows (e.g. fox or pos:propn), click a header to sort", id="filter-input")
                     yield DataTable(id="result-table")
                     yield Static("Results will appear here", id="result-display")
         
@@ -168,27 +188,95 @@ class NLPApp(App):
         except Exception as e:
             self.update_status(f"❌ Error: {e}")
     
-    def show_tokenization(self):
-        """Display tokenization results."""
-        if not self.doc:
-            self.update_status("❌ Please process text first")
-            return
-        
-        # Get the table widget
+    def show_table(self, columns, rows):
+        """Index the rows for filtering/sorting and display them."""
         table = self.query_one("#result-table", DataTable)
         table.clear(columns=True)
         table.display = True
         
-        # Hide text display
         result_display = self.query_one("#result-display", Static)
         result_display.display = False
         
-        # Setup table
-        table.add_column("Token #", width=10)
-        table.add_column("Token", width=30)
+        for name, width in columns:
+            table.add_column(name, width=width)
+        
+        # Indexing a large result takes a while, so it happens in the worker
+        self.result_index = None
+        self.sort_column = None
+        self.sort_reverse = False
+        self.view_seq += 1
+        self.table_seq = self.view_seq
+        self.update_status(f"Indexing {len(rows)} rows...")
+        query = self.query_one("#filter-input", Input).value
+        self.build_index(self.view_seq, [name for name, _ in columns], rows, query)
+    
+    @work(thread=True, exclusive=True, group="index")
+    def build_index(self, seq, columns, rows, query):
+        """Index a new result table off the UI thread, then show its first view."""
+        index = ResultIndex(columns, rows)
+        row_ids = index.view(query)
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.render_view, seq, index, row_ids, query)
+    
+    def refresh_view(self):
+        """Recompute the visible rows for the current filter and sort."""
+        if self.result_index is None:
+            return  # still indexing; the finished index is shown with the current filter
+        query = self.query_one("#filter-input", Input).value
+        self.view_seq += 1
+        self.compute_view(self.view_seq, self.result_index, query, self.sort_column, self.sort_reverse)
+    
+    @work(thread=True, exclusive=True, group="view")
+    def compute_view(self, seq, index, query, sort_column, reverse):
+        """Filter and sort off the UI thread, then hand the rows back."""
+        row_ids = index.view(query, sort_column, reverse)
+        if not get_current_worker().is_cancelled:
+            self.call_from_thread(self.render_view, seq, index, row_ids, query)
+    
+    def render_view(self, seq, index, row_ids, query):
+        # Thread workers are not interrupted by exclusive=True, so an older
+        # view can still finish after a newer one; drop it
+        if seq < self.applied_seq:
+            return
+        installed = index is not self.result_index
+        if installed:
+            if seq != self.table_seq:
+                return  # a newer analysis replaced the table meanwhile
+            self.result_index = index
+        self.applied_seq = seq
+        table = self.query_one("#result-table", DataTable)
+        table.clear()
+        table.add_rows(index.rows[i] for i in row_ids[:DISPLAY_LIMIT])
+        shown = min(len(row_ids), DISPLAY_LIMIT)
+        self.update_status(f"Showing {shown} of {len(row_ids)} matching rows ({len(index)} total)")
+        if installed and query != self.query_one("#filter-input", Input).value:
+            self.refresh_view()  # the filter was edited while indexing
+    
+    def on_input_changed(self, event: Input.Changed) -> None:
+        if event.input.id == "filter-input":
+            self.refresh_view()
+    
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        """Sort by the clicked column; clicking it again reverses the order."""
+        if self.result_index is None:
+            return
+        column = self.result_index.columns[event.column_index]
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.refresh_view()
+    
+    def show_tokenization(self):
+        """Display tokenization results."""
+        if not self.doc:
+            self.update_status("❌ Please process text first")
+            return
         
-        for index, token in enumerate(self.doc, start=1):
-            table.add_row(str(index), token.text)
+        columns = [("Token #", 10), ("Token", 30)]
+        rows = [(str(index), token.text) for index, token in enumerate(self.doc, start=1)]
+        self.show_table(columns, rows)
     
     def show_linguistic_annotation(self):
         """Display linguistic annotations."""
@@ -196,27 +284,18 @@ class NLPApp(App):
             self.update_status("❌ Please process text first")
             return
         
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        table.display = True
-        
-        result_display = self.query_one("#result-display", Static)
-        result_display.display = False
-        
-        table.add_column("Token", width=15)
-        table.add_column("POS", width=10)
-        table.add_column("Lemma", width=15)
-        table.add_column("Dependency", width=12)
-        table.add_column("Entity", width=10)
-        
-        for token in self.doc:
-            table.add_row(
+        columns = [("Token", 15), ("POS", 10), ("Lemma", 15), ("Dependency", 12), ("Entity", 10)]
+        rows = [
+            (
                 token.text,
                 token.pos_,
                 token.lemma_,
                 token.dep_,
                 token.ent_type_ if token.ent_type_ else "-"
             )
+            for token in self.doc
+        ]
+        self.show_table(columns, rows)
     
     def show_lemmatization(self):
         """Display lemmatization results."""
@@ -224,18 +303,9 @@ class NLPApp(App):
             self.update_status("❌ Please process text first")
             return
         
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        table.display = True
-        
-        result_display = self.query_one("#result-display", Static)
-        result_display.display = False
-        
-        table.add_column("Token", width=25)
-        table.add_column("Lemma", width=25)
-        
-        for token in self.doc:
-            table.add_row(token.text, token.lemma_)
+        columns = [("Token", 25), ("Lemma", 25)]
+        rows = [(token.text, token.lemma_) for token in self.doc]
+        self.show_table(columns, rows)
     
     def show_sentence_detection(self):
         """Display sentence detection results."""
@@ -243,18 +313,9 @@ class NLPApp(App):
             self.update_status("❌ Please process text first")
             return
         
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        table.display = True
-        
-        result_display = self.query_one("#result-display", Static)
-        result_display.display = False
-        
-        table.add_column("Sentence #", width=12)
-        table.add_column("Sentence", width=70)
-        
-        for index, sent in enumerate(self.doc.sents, start=1):
-            table.add_row(str(index), sent.text)
+        columns = [("Sentence #", 12), ("Sentence", 70)]
+        rows = [(str(index), sent.text) for index, sent in enumerate(self.doc.sents, start=1)]
+        self.show_table(columns, rows)
     
     def show_pos_tagging(self):
         """Display POS tagging results."""
@@ -262,21 +323,12 @@ class NLPApp(App):
             self.update_status("❌ Please process text first")
             return
         
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        table.display = True
-        
-        result_display = self.query_one("#result-display", Static)
-        result_display.display = False
-        
-        table.add_column("Token", width=15)
-        table.add_column("POS", width=10)
-        table.add_column("Tag", width=10)
-        table.add_column("Detail", width=40)
-        
-        for token in self.doc:
-            detail = spacy.explain(token.tag_) if spacy.explain(token.tag_) else "-"
-            table.add_row(token.text, token.pos_, token.tag_, detail)
+        columns = [("Token", 15), ("POS", 10), ("Tag", 10), ("Detail", 40)]
+        rows = [
+            (token.text, token.pos_, token.tag_, spacy.explain(token.tag_) or "-")
+            for token in self.doc
+        ]
+        self.show_table(columns, rows)
     
     def show_ner(self):
         """Display named entity recognition results."""
@@ -293,17 +345,12 @@ class NLPApp(App):
             result_display.update("No named entities found in the text.")
             return
         
-        table.clear(columns=True)
-        table.display = True
-        result_display.display = False
-        
-        table.add_column("Entity", width=25)
-        table.add_column("Type", width=15)
-        table.add_column("Explanation", width=40)
-        
-        for ent in self.doc.ents:
-            explanation = spacy.explain(ent.label_) if spacy.explain(ent.label_) else "-"
-            table.add_row(ent.text, ent.label_, explanation)
+        columns = [("Entity", 25), ("Type", 15), ("Explanation", 40)]
+        rows = [
+            (ent.text, ent.label_, spacy.explain(ent.label_) or "-")
+            for ent in self.doc.ents
+        ]
+        self.show_table(columns, rows)
     
     def show_stop_words(self):
         """Display stop words removal results."""
@@ -332,20 +379,9 @@ class NLPApp(App):
             self.update_status("❌ Please process text first")
             return
         
-        table = self.query_one("#result-table", DataTable)
-        table.clear(columns=True)
-        table.display = True
-        
-        result_display = self.query_one("#result-display", Static)
-        result_display.display = False
-        
-        table.add_column("Token", width=15)
-        table.add_column("Dependency", width=12)
-        table.add_column("Head", width=15)
-        table.add_column("POS", width=10)
-        
-        for token in self.doc:
-            table.add_row(token.text, token.dep_, token.head.text, token.pos_)
+        columns = [("Token", 15), ("Dependency", 12), ("Head", 15), ("POS", 10)]
+        rows = [(token.text, token.dep_, token.head.text, token.pos_) for token in self.doc]
+        self.show_table(columns, rows)
     
     def action_clear(self):
         """Clear the results."""
@@ -357,6 +393,10 @@ class NLPApp(App):
         result_display.update("Results will appear here")
         self.update_status("✓ Cleared")
     
+    def action_focus_filter(self):
+        """Move focus to the filter box."""
+        self.query_one("#filter-input", Input).focus()
+    
     def action_quit(self):
         """Quit the application."""
         self.exit()
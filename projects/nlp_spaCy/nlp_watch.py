@@ -0,0 +1,245 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import spacy
+
+MANIFEST_NAME = "manifest.json"
+# The only files clean_output() may delete: results laid out by
+# output_path() as <2 hex>/<16 hex>-<16 hex>.json, and the .<pid>.tmp files
+# write_json_atomic() leaves behind when a run is killed mid-write
+SHARD_DIR = re.compile(r"[0-9a-f]{2}")
+RESULT_FILE = re.compile(r"[0-9a-f]{16}-[0-9a-f]{16}\.json(\.\d+\.tmp)?")
+MANIFEST_TMP = re.compile(re.escape(MANIFEST_NAME) + r"\.\d+\.tmp")
+
+# One model per worker process, loaded by the pool initializer
+_nlp = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally analyze a folder of text files with spaCy.")
+    parser.add_argument("source", help="directory that receives the .txt files")
+    parser.add_argument("output", help="directory for the analysis results and the manifest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="size of the process pool")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between folder scans")
+    parser.add_argument("--once", action="store_true", help="sync once and exit instead of watching")
+    args = parser.parse_args()
+
+    header()
+    # One pool for the life of the program, so each worker loads the model
+    # once. Workers are started on demand, so a quiet folder costs nothing.
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker) as pool:
+        if args.once:
+            sync(args.source, args.output, pool)
+            return
+        watch(args.source, args.output, pool, args.interval)
+
+
+def header():
+    dash()
+    print("NLP Watch Folder - incremental spaCy processing")
+    dash()
+
+
+def watch(source, output, pool, interval):
+    print(f"Watching {source} every {interval:g}s (Ctrl+C to stop)")
+    dash()
+    try:
+        sync(source, output, pool)
+        while True:
+            time.sleep(interval)
+            sync(source, output, pool, clean=False)
+    except KeyboardInterrupt:
+        dash()
+        print("Stopped watching. Goodbye!")
+        dash()
+
+
+def sync(source, output, pool, clean=True):
+    """Bring the output folder in line with the source folder.
+
+    Only new or changed files are analyzed; outputs of deleted files are
+    removed. The manifest is checkpointed while the pool runs, so a crashed
+    run resumes from it. With clean, files a crashed run left behind are
+    removed once the manifest is up to date.
+    """
+    os.makedirs(output, exist_ok=True)
+    manifest_path = os.path.join(output, MANIFEST_NAME)
+    manifest = load_manifest(manifest_path)
+
+    current = scan(source)
+    removed = [path for path in manifest if path not in current]
+    for path in removed:
+        remove_output(manifest.pop(path)["output"])
+    if removed:
+        save_manifest(manifest_path, manifest)
+
+    pending = []
+    for path, (size, mtime) in current.items():
+        entry = manifest.get(path)
+        if entry and entry["size"] == size and entry["mtime"] == mtime:
+            continue
+        try:
+            digest = file_hash(path)
+        except FileNotFoundError:
+            continue  # deleted since the scan; the next sync drops it
+        if entry and entry["hash"] == digest:
+            # Touched but not changed: refresh the stat fields only
+            entry["size"], entry["mtime"] = size, mtime
+            continue
+        pending.append((path, digest, size, mtime))
+
+    if not pending:
+        save_manifest(manifest_path, manifest)
+        if clean:
+            clean_output(output, manifest)
+        print(f"Up to date: {len(current)} files, {len(removed)} removed.")
+        dash()
+        return
+
+    print(f"Processing {len(pending)} new or changed files ({len(removed)} removed)...")
+    failed = 0
+    last_save = time.monotonic()
+    futures = {
+        pool.submit(analyze_file, path, output_path(output, path, digest)): (path, digest, size, mtime)
+        for path, digest, size, mtime in pending
+    }
+    for future in as_completed(futures):
+        path, digest, size, mtime = futures[future]
+        try:
+            out = future.result()
+            error = None
+        except Exception as e:
+            failed += 1
+            print(f"❌ {path}: {e}")
+            # Recorded with its hash, so it is not retried until the file changes
+            out, error = None, str(e)
+        old = manifest.get(path)
+        if old and old["output"] != out:
+            remove_output(old["output"])
+        manifest[path] = {"hash": digest, "size": size, "mtime": mtime, "output": out, "error": error}
+        if time.monotonic() - last_save > 1.0:
+            save_manifest(manifest_path, manifest)
+            last_save = time.monotonic()
+    save_manifest(manifest_path, manifest)
+    # Every future is done, so no worker is still writing a temporary file
+    clean_output(output, manifest)
+
+    print(f"✓ Processed {len(pending) - failed} files, {failed} failed.")
+    dash()
+
+
+def scan(source):
+    files = {}
+    for root, _, names in os.walk(source):
+        for name in names:
+            if not name.endswith(".txt"):
+                continue
+            path = os.path.abspath(os.path.join(root, name))
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue  # deleted while walking
+            files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def file_hash(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_path(output, path, digest):
+    # Named after both the source path and its content, so a result left
+    # behind by a crashed run is picked up again instead of recomputed
+    key = hashlib.sha256(path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(output, key[:2], f"{key}-{digest[:16]}.json")
+
+
+def init_worker():
+    global _nlp
+    _nlp = spacy.load("en_core_web_sm")
+
+
+def analyze_file(path, out):
+    if os.path.exists(out):
+        return out
+
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    doc = _nlp(text)
+    result = {
+        "source": path,
+        "tokens": [
+            {"text": t.text, "pos": t.pos_, "tag": t.tag_, "lemma": t.lemma_,
+             "dep": t.dep_, "head": t.head.i, "ent": t.ent_type_, "stop": t.is_stop}
+            for t in doc
+        ],
+        "sentences": [[s.start, s.end] for s in doc.sents],
+        "entities": [{"text": e.text, "label": e.label_, "start": e.start, "end": e.end} for e in doc.ents],
+    }
+    write_json_atomic(out, result)
+    return out
+
+
+def remove_output(out):
+    if out is None:
+        return  # the analysis failed, so there is no result file
+    try:
+        os.remove(out)
+    except FileNotFoundError:
+        pass
+
+
+def clean_output(output, manifest):
+    """Remove temporary files and results the manifest does not point to,
+    such as those left behind by a run that crashed.
+
+    Only files in this module's own layout are touched, so anything else
+    in the output directory is left alone.
+    """
+    keep = {os.path.abspath(entry["output"]) for entry in manifest.values() if entry["output"]}
+    for name in os.listdir(output):
+        path = os.path.join(output, name)
+        if MANIFEST_TMP.fullmatch(name):
+            remove_output(path)
+        elif SHARD_DIR.fullmatch(name) and os.path.isdir(path):
+            for result in os.listdir(path):
+                result_path = os.path.abspath(os.path.join(path, result))
+                if RESULT_FILE.fullmatch(result) and result.startswith(name) and result_path not in keep:
+                    remove_output(result_path)
+
+
+def load_manifest(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(path, manifest):
+    write_json_atomic(path, manifest)
+
+
+def write_json_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def dash():
+    print("=" * 100)
+
+
+if __name__ == "__main__":
+    main()
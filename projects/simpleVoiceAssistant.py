@@ -1,46 +1,29 @@
-# here i am importing pyttsx3
-import pyttsx3
+import os
+
+# here i am importing the speech service and the question matcher
+from intents import load_intents
+from speech import SpeechService
+
+# here i am starting the speech engine once, it talks in the background
+friend = SpeechService()
+
+# here are the questions and answers, loaded from qna.tsv
+qna = load_intents(os.path.join(os.path.dirname(os.path.abspath(__file__)), "qna.tsv"))
 
 # here looping starts for chat bot
 while True:
 
-    # here i am storing pyttsx3.init() as variable friend
-    friend = pyttsx3.init()
-
 # here is the user input qustion
     user_input_question = input("What do you want to know? Type here: ")
 
 # here is the answer for invalid question
     invalid_question_answer = "will you repeat again. i have not got it"
 
-# here is the first greating
-    greating01 = ("hello")
-    greating01reply = ("hey there")
-
-# here is the first qna
-    question01 = "who are you"
-    question01reply = "i am a simple bot created by ibrahim mustafa opu"
-
-# here is the first qna
-    ending01 = "bye"
-    ending01reply = "bye. meet you again"
-
-# here is the function for qna
-    if user_input_question == greating01:
-        print(greating01reply)
-        friend.say(greating01reply)
-    elif user_input_question == question01:
-        print(question01reply)
-        friend.say(question01reply)
-    elif user_input_question == ending01:
-        print(ending01reply)
-        friend.say(ending01reply)
-    else:
-        print(invalid_question_answer)
-        friend.say(invalid_question_answer)
-
-# here i am returning variable friend
-    friend.runAndWait()
+# here is the answer for the closest known question
+    match = qna.match(user_input_question)
+    answer = match.answer if match else invalid_question_answer
+    print(answer)
+    friend.say(answer, interrupt=True)
 
 # here is the user permission for the next qna
     user_permission_for_next_qna = input(
@@ -50,7 +33,7 @@ while True:
     elif user_permission_for_next_qna == "no":
         break
     else:
-        friend.say("invalid input. returning to the qna section")
+        friend.say("invalid input. returning to the qna section", interrupt=True)
 
-# here i am returning variable friend
-    friend.runAndWait()
+# here i am waiting for the last answer to be spoken before exiting
+friend.wait()
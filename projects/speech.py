@@ -0,0 +1,108 @@
+# Text-to-speech on a background thread
+#
+# pyttsx3.init() is slow, and runAndWait() blocks until the sentence has
+# been spoken. SpeechService creates one engine, on a thread of its own,
+# and feeds it from a queue. say() returns at once, so the input loop
+# keeps going while speech plays. Saying something with interrupt=True
+# cuts off the current sentence and drops anything still waiting.
+#
+#   friend = SpeechService()
+#   friend.say("hey there", interrupt=True)
+#   friend.wait()      # before exiting, so the last sentence is heard
+import queue
+import threading
+import time
+
+import pyttsx3
+
+# How often the speech thread checks for interruptions while speaking
+POLL_INTERVAL = 0.02
+
+
+class SpeechService(object):
+    def __init__(self, rate=None, voice=None, stale_after=None, init=pyttsx3.init):
+        """stale_after: seconds after which a queued sentence is no longer worth saying."""
+        self.stale_after = stale_after
+        self._init = init
+        self._settings = {"rate": rate, "voice": voice}
+        self._queue = queue.Queue()
+        self._generation = 0
+        self._ready = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error:
+            raise self._error
+
+    def say(self, text, interrupt=False):
+        if interrupt:
+            self.interrupt()
+        self._queue.put((self._generation, time.monotonic(), text))
+
+    def interrupt(self):
+        """Stop the current sentence and drop everything queued before now."""
+        self._generation += 1
+
+    def wait(self):
+        """Block until everything queued so far has been spoken (or dropped).
+
+        A sentence the engine failed on counts as dropped; the last such
+        error is kept in .error.
+        """
+        self._queue.join()
+
+    @property
+    def error(self):
+        return self._error
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _is_stale(self, generation, queued_at):
+        if generation < self._generation:
+            return True
+        return self.stale_after is not None and time.monotonic() - queued_at > self.stale_after
+
+    def _run(self):
+        # The engine lives and dies on this thread; some drivers require that
+        try:
+            engine = self._init()
+            for name, value in self._settings.items():
+                if value is not None:
+                    engine.setProperty(name, value)
+            engine.startLoop(False)
+        except Exception as e:
+            self._error = e
+            return
+        finally:
+            self._ready.set()
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is None:
+                        break
+                    generation, queued_at, text = item
+                    if not self._is_stale(generation, queued_at):
+                        try:
+                            self._speak(engine, generation, text)
+                        except Exception as e:
+                            # Keep draining the queue, or wait() never returns
+                            self._error = e
+                finally:
+                    self._queue.task_done()
+        finally:
+            engine.endLoop()
+
+    def _speak(self, engine, generation, text):
+        engine.say(text)
+        while True:
+            engine.iterate()
+            if not engine.isBusy():
+                return
+            if generation < self._generation:
+                engine.stop()
+                return
+            time.sleep(POLL_INTERVAL)
@@ -0,0 +1,183 @@
+# Export turtle animations as an animated GIF or a numbered PNG sequence
+#
+# The script is recorded once with turtle_headless, so the whole path is
+# known up front. Frame k shows the first (k + 1) / n of its segments.
+# Frames are split into contiguous ranges across a process pool. Each
+# worker draws the path up to its first frame, then adds only the new
+# segments for every later frame. Pixels are kept as palette indexes,
+# and GIF frames only store the rectangle that changed. The expensive
+# per-frame encoding therefore happens in the workers, and the parent
+# only joins the bytes.
+#
+#   python turtle_animate.py coronavirus.py spiral.gif [--frames 60] [--fps 30]
+#   python turtle_animate.py flower.py frames/            (frame_00000.png, ... for ffmpeg)
+import argparse
+import math
+import os
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from turtle_headless import CANVAS_SIZE, draw_polyline, encode_png, fill_polygon, record, rgb
+
+
+def _palette(drawing):
+    colors = [rgb(drawing.bgcolor)]
+    for item in drawing.items:
+        if item and rgb(item.color) not in colors:
+            colors.append(rgb(item.color))
+    if len(colors) > 256:
+        raise ValueError("GIF frames are limited to 256 colors")
+    return colors
+
+
+def _code_size(palette):
+    """GIF minimum LZW code size; the color table has 2 ** this entries."""
+    return max(2, math.ceil(math.log2(len(palette))))
+
+
+def _frame_items(drawing, size, palette):
+    """Pixel-space items as (kind, points, color index, width, first segment)."""
+    items, position = [], 0
+    for item in drawing.pixel_items(size):
+        items.append((item.kind, item.points, palette.index(rgb(item.color)), item.width, position))
+        if item.kind == "line":
+            position += len(item.points) - 1
+    return items, position
+
+
+def _draw_segments(image, items, lo, hi, total):
+    """Draw the segments lo..hi-1 of the whole path; fills appear where they start."""
+    for kind, points, color, width, first in items:
+        if kind == "fill":
+            if lo <= first < hi or first == hi == total:
+                fill_polygon(image, points, color)
+            continue
+        a, b = max(lo - first, 0), min(hi - first, len(points) - 1)
+        if a < b:
+            draw_polyline(image, points[a:b + 1], color, width)
+
+
+def _gif_image(image, previous, min_code_size, delay):
+    """Graphic control extension and image block for the changed rectangle."""
+    if previous is None:
+        top, left, bottom, right = 0, 0, image.shape[0], image.shape[1]
+    else:
+        changed = image != previous
+        rows, cols = np.flatnonzero(changed.any(axis=1)), np.flatnonzero(changed.any(axis=0))
+        if len(rows):
+            top, bottom, left, right = rows[0], rows[-1] + 1, cols[0], cols[-1] + 1
+        else:
+            top, left, bottom, right = 0, 0, 1, 1
+    pixels = image[top:bottom, left:right].ravel()
+
+    # Uncompressed LZW: a clear code before every group of pixels keeps the
+    # decoder's table (and so the code width) from growing, so encoding is a
+    # fixed-width bit packing that NumPy does in one pass
+    clear, width = 1 << min_code_size, min_code_size + 1
+    group = clear - 2
+    codes = np.insert(pixels.astype(np.uint16), np.arange(0, len(pixels), group), clear)
+    codes = np.append(codes, clear + 1)
+    bits = ((codes[:, None] >> np.arange(width)) & 1).astype(np.uint8)
+    data = np.packbits(bits.ravel(), bitorder="little").tobytes()
+    blocks = b"".join(bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255))
+
+    control = b"\x21\xf9\x04\x04" + struct.pack("<H", delay) + b"\x00\x00"  # disposal: keep previous frame
+    descriptor = b"\x2c" + struct.pack("<HHHHB", left, top, right - left, bottom - top, 0)
+    return control + descriptor + bytes([min_code_size]) + blocks + b"\x00"
+
+
+def render_frames(items, total, size, stops, start, palette, output, delay=3):
+    """Draw frames whose segment counts are stops (the frame before has start
+    segments). Returns GIF image blocks, or writes PNGs when output is a directory."""
+    image = np.zeros((size[1], size[0]), dtype=np.uint8)
+    _draw_segments(image, items, 0, start, total)
+    previous = image.copy() if start else None
+    min_code_size = _code_size(palette)
+    colors = np.array(palette, dtype=np.uint8)
+
+    blocks = []
+    lo = start
+    for number, hi in stops:
+        _draw_segments(image, items, lo, hi, total)
+        lo = hi
+        if output:
+            with open(os.path.join(output, f"frame_{number:05d}.png"), "wb") as f:
+                f.write(encode_png(colors[image]))
+        else:
+            blocks.append(_gif_image(image, previous, min_code_size, delay))
+            previous = image.copy()
+    return blocks
+
+
+def _render_range(args):
+    return render_frames(*args)
+
+
+def _results(tasks, workers):
+    if workers == 1:
+        yield from map(_render_range, tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_render_range, tasks)
+
+
+def export(script, output, frames=60, fps=30, size=CANVAS_SIZE, workers=None):
+    """Write script's animation to output (.gif, or a directory of PNGs)."""
+    drawing = record(script)
+    palette = _palette(drawing)
+    items, total = _frame_items(drawing, size, palette)
+    stops = [(k, round(total * (k + 1) / frames)) for k in range(frames)]
+
+    png_dir = None if output.endswith(".gif") else output
+    if png_dir:
+        os.makedirs(png_dir, exist_ok=True)
+
+    # A few ranges per worker keeps the pool busy; each range redraws the
+    # path up to its start, which is one vectorized pass
+    workers = workers or os.cpu_count() or 1
+    n_ranges = min(frames, 4 * workers)
+    bounds = np.linspace(0, frames, n_ranges + 1).astype(int)
+    tasks = []
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        if a < b:
+            start = stops[a - 1][1] if a else 0
+            tasks.append((items, total, size, stops[a:b], start, palette, png_dir, round(100 / fps)))
+
+    results = _results(tasks, workers)
+    if png_dir:
+        for _ in results:
+            pass
+        return
+
+    code_size = _code_size(palette)
+    with open(output, "wb") as f:
+        # Header, then a global color table padded to 2 ** code_size entries
+        f.write(b"GIF89a" + struct.pack("<HHBBB", size[0], size[1], 0xF0 | (code_size - 1), 0, 0))
+        f.write(b"".join(bytes(c) for c in palette) + bytes(3 * (2 ** code_size - len(palette))))
+        f.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00")  # loop forever
+        for blocks in results:
+            f.writelines(blocks)
+        f.write(b"\x3b")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a turtle animation as a GIF or PNG frames.")
+    parser.add_argument("script")
+    parser.add_argument("output", help="file.gif, or a directory for frame_00000.png ...")
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--size", default="%dx%d" % CANVAS_SIZE, help="WIDTHxHEIGHT")
+    parser.add_argument("--workers", type=int, help="processes (default: all cores)")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    start = time.perf_counter()
+    export(args.script, args.output, args.frames, args.fps, size, args.workers)
+    print(f"{args.output}: {args.frames} frames in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
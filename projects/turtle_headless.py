@@ -0,0 +1,546 @@
+# Headless turtle: record the turtle scripts and rasterize them offline
+#
+# record() runs an unchanged turtle script (heart.py, flower.py,
+# shohid_minar.py, coronavirus.py, wave.py, ...) against a mock turtle
+# module, so no Tk display is needed. The moves become a Drawing: pen
+# polylines and filled polygons in world coordinates, in drawing order.
+# Drawings render to SVG as text, and to PNG either with Pillow or with
+# the NumPy rasterizer here. That rasterizer has no antialiasing and no
+# dependencies, so image_hash() is stable across machines.
+#
+#   python turtle_headless.py SCRIPT.py [OUT.png|OUT.svg] [--size 800x600]
+import argparse
+import hashlib
+import math
+import os
+import runpy
+import struct
+import sys
+import time
+import types
+import zlib
+from collections import namedtuple
+
+import numpy as np
+
+Item = namedtuple("Item", "kind points color width")
+
+# Tk 8.6 values, as turtle would show them
+COLORS = {
+    "black": (0, 0, 0), "white": (255, 255, 255), "red": (255, 0, 0), "green": (0, 128, 0),
+    "blue": (0, 0, 255), "yellow": (255, 255, 0), "cyan": (0, 255, 255), "magenta": (255, 0, 255),
+    "gray": (128, 128, 128), "grey": (128, 128, 128), "pink": (255, 192, 203),
+    "orange": (255, 165, 0), "purple": (128, 0, 128), "brown": (165, 42, 42),
+    "maroon": (128, 0, 0), "navy": (0, 0, 128), "gold": (255, 215, 0), "violet": (238, 130, 238),
+    "skyblue": (135, 206, 235), "lightblue": (173, 216, 230), "darkgreen": (0, 100, 0),
+}
+
+# Canvas size the mock screen pretends to have, for setworldcoordinates
+CANVAS_SIZE = (800, 600)
+
+
+def rgb(color):
+    """(r, g, b) in 0..255 for a Tk color name, #rrggbb string or 0..255 tuple."""
+    if isinstance(color, tuple):
+        return tuple(int(round(c)) for c in color)
+    name = color.strip().lower().replace(" ", "")
+    if name.startswith("#") and len(name) == 7:
+        return tuple(int(name[i:i + 2], 16) for i in (1, 3, 5))
+    if name in COLORS:
+        return COLORS[name]
+    raise ValueError(f"Unknown color: {color}")
+
+
+class Drawing(object):
+    def __init__(self):
+        self.items = []
+        self.bgcolor = "white"
+        self.world = None  # (llx, lly, urx, ury) after setworldcoordinates
+
+    @property
+    def segments(self):
+        return sum(len(item.points) - 1 for item in self.items if item and item.kind == "line")
+
+    def _transform(self, size):
+        """World -> pixel mapping for an image of the given (width, height)."""
+        w, h = size
+        if self.world:
+            llx, lly, urx, ury = self.world
+            sx, sy = w / (urx - llx), h / (ury - lly)
+            return lambda p: np.column_stack(((p[:, 0] - llx) * sx, (ury - p[:, 1]) * sy))
+
+        points = [item.points for item in self.items if item]
+        if not points:
+            return lambda p: p
+        allp = np.concatenate(points)
+        lo, hi = allp.min(axis=0), allp.max(axis=0)
+        margin = 20
+        scale = min((w - 2 * margin) / max(hi[0] - lo[0], 1e-9), (h - 2 * margin) / max(hi[1] - lo[1], 1e-9))
+        cx, cy = (lo + hi) / 2
+        return lambda p: np.column_stack((w / 2 + (p[:, 0] - cx) * scale, h / 2 - (p[:, 1] - cy) * scale))
+
+    def pixel_items(self, size):
+        """The items with their points in pixel coordinates, in drawing order."""
+        to_pixels = self._transform(size)
+        for item in self.items:
+            if item and len(item.points):
+                yield item._replace(points=to_pixels(item.points))
+
+    def to_svg(self, size=CANVAS_SIZE):
+        w, h = size
+        out = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">',
+               f'<rect width="100%" height="100%" fill="{_svg_color(self.bgcolor)}"/>']
+        for item in self.pixel_items(size):
+            pts = " ".join(f"{x:.2f},{y:.2f}" for x, y in item.points.tolist())
+            if item.kind == "fill":
+                out.append(f'<polygon points="{pts}" fill="{_svg_color(item.color)}" stroke="none"/>')
+            else:
+                out.append(f'<polyline points="{pts}" fill="none" stroke="{_svg_color(item.color)}" '
+                           f'stroke-width="{item.width}" stroke-linejoin="round" stroke-linecap="round"/>')
+        out.append("</svg>")
+        return "\n".join(out) + "\n"
+
+    def rasterize(self, size=CANVAS_SIZE):
+        """(height, width, 3) uint8 image, no antialiasing, NumPy only."""
+        w, h = size
+        image = np.empty((h, w, 3), dtype=np.uint8)
+        image[:] = rgb(self.bgcolor)
+        for item in self.pixel_items(size):
+            if item.kind == "fill":
+                fill_polygon(image, item.points, rgb(item.color))
+            else:
+                draw_polyline(image, item.points, rgb(item.color), item.width)
+        return image
+
+    def to_png(self, size=CANVAS_SIZE, backend=None):
+        """PNG bytes; backend is "pillow", "numpy" or None for Pillow if installed."""
+        if backend in (None, "pillow"):
+            try:
+                return self._pillow_png(size)
+            except ImportError:
+                if backend == "pillow":
+                    raise
+        return encode_png(self.rasterize(size))
+
+    def _pillow_png(self, size):
+        import io
+
+        from PIL import Image, ImageDraw
+
+        image = Image.new("RGB", size, rgb(self.bgcolor))
+        draw = ImageDraw.Draw(image)
+        for item in self.pixel_items(size):
+            pts = [tuple(p) for p in item.points.tolist()]
+            if item.kind == "fill":
+                if len(pts) >= 3:
+                    draw.polygon(pts, fill=rgb(item.color))
+            else:
+                draw.line(pts, fill=rgb(item.color), width=max(int(item.width), 1), joint="curve")
+        buf = io.BytesIO()
+        image.save(buf, format="PNG")
+        return buf.getvalue()
+
+    def image_hash(self, size=CANVAS_SIZE):
+        """sha256 of the NumPy-rasterized pixels, for comparing drawings in tests."""
+        image = self.rasterize(size)
+        return hashlib.sha256(struct.pack(">II", *size) + image.tobytes()).hexdigest()
+
+
+def _svg_color(color):
+    if isinstance(color, tuple):
+        return "#%02x%02x%02x" % rgb(color)
+    return color
+
+
+def draw_polyline(image, points, color, width):
+    """Sample every segment at sub-pixel steps and stamp a square pen."""
+    h, w = image.shape[:2]
+    if len(points) == 1:
+        points = np.repeat(points, 2, axis=0)
+    start, end = points[:-1], points[1:]
+    counts = np.ceil(np.hypot(*(end - start).T) * 2).astype(int) + 1
+    seg = np.repeat(np.arange(len(start)), counts)
+    first = np.repeat(np.cumsum(counts) - counts, counts)
+    t = (np.arange(counts.sum()) - first) / np.repeat(np.maximum(counts - 1, 1), counts)
+    samples = start[seg] + (end - start)[seg] * t[:, None]
+
+    r = max(int(width), 1)
+    offsets = np.arange(r) - (r - 1) // 2
+    xs = np.floor(samples[:, 0]).astype(int)[:, None] + offsets[None, :]
+    ys = np.floor(samples[:, 1]).astype(int)[:, None] + offsets[None, :]
+    xs = np.repeat(xs, r, axis=1).ravel()
+    ys = np.tile(ys, (1, r)).ravel()
+    keep = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+    image[ys[keep], xs[keep]] = color
+
+
+def fill_polygon(image, points, color):
+    """Even-odd scanline fill at pixel centers, all rows at once."""
+    h, w = image.shape[:2]
+    if len(points) < 3:
+        return
+    x0, y0 = points[:, 0], points[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    rows = np.arange(max(int(np.floor(y0.min())), 0), min(int(np.ceil(y0.max())) + 1, h))
+    if not len(rows):
+        return
+    yc = rows[:, None] + 0.5
+    crosses = (y0 <= yc) != (y1 <= yc)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xs = np.where(crosses, x0 + (yc - y0) * (x1 - x0) / (y1 - y0), np.inf)
+    xs.sort(axis=1)
+
+    # Pairs of crossings are spans; mark span starts and ends, then cumsum
+    left, right = xs[:, 0::2], xs[:, 1::2]
+    k = min(left.shape[1], right.shape[1])
+    left, right = left[:, :k], right[:, :k]
+    valid = np.isfinite(right)
+    start = np.clip(np.ceil(left - 0.5), 0, w).astype(int)
+    stop = np.clip(np.floor(right - 0.5) + 1, 0, w).astype(int)
+    valid &= stop > start
+    marks = np.zeros((len(rows), w + 1), dtype=np.int32)
+    row_index = np.broadcast_to(np.arange(len(rows))[:, None], valid.shape)
+    np.add.at(marks, (row_index[valid], start[valid]), 1)
+    np.add.at(marks, (row_index[valid], stop[valid]), -1)
+    inside = np.cumsum(marks[:, :w], axis=1) > 0
+    image[rows[:, None].repeat(w, axis=1)[inside], np.nonzero(inside)[1]] = color
+
+
+def encode_png(image):
+    h, w = image.shape[:2]
+    raw = np.empty((h, 1 + 3 * w), dtype=np.uint8)
+    raw[:, 0] = 0  # filter type None for every row
+    raw[:, 1:] = image.reshape(h, -1)
+
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)) + chunk(b"IEND", b""))
+
+
+# The mock turtle module
+
+class _Canvas(object):
+    """Enough of a Tk canvas for turtle_render.draw to draw on."""
+
+    def __init__(self, screen):
+        self.screen = screen
+
+    def create_line(self, *coords, fill="black", width=1):
+        flat = np.asarray(coords, dtype=float)
+        points = np.column_stack((flat[0::2] / self.screen.xscale, -flat[1::2] / self.screen.yscale))
+        self.screen.drawing.items.append(Item("line", points, fill, width))
+
+
+class _Screen(object):
+    def __init__(self, drawing):
+        self.drawing = drawing
+        self.xscale = self.yscale = 1.0
+        self.mode = 1.0
+        self.canvas = _Canvas(self)
+
+    def bgcolor(self, *color):
+        if not color:
+            return self.drawing.bgcolor
+        self.drawing.bgcolor = self._color(color)
+
+    def colormode(self, mode=None):
+        if mode is None:
+            return self.mode
+        self.mode = mode
+
+    def _color(self, args):
+        if len(args) == 1:
+            args = args[0]
+        if isinstance(args, str):
+            return args
+        return tuple(c * 255 / self.mode for c in args)
+
+    def setworldcoordinates(self, llx, lly, urx, ury):
+        self.drawing.world = (llx, lly, urx, ury)
+        self.xscale = CANVAS_SIZE[0] / (urx - llx)
+        self.yscale = CANVAS_SIZE[1] / (ury - lly)
+
+    def getcanvas(self):
+        return self.canvas
+
+    def window_width(self):
+        return CANVAS_SIZE[0]
+
+    def window_height(self):
+        return CANVAS_SIZE[1]
+
+    def __getattr__(self, name):
+        # tracer, update, title, setup, mainloop, done, exitonclick, listen, ...
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+class _Turtle(object):
+    # Methods that only affect how the turtle itself looks or how fast it moves
+    NOOPS = ("speed", "shape", "shapesize", "hideturtle", "ht", "showturtle", "st", "write",
+             "tracer", "delay", "onclick", "ondrag", "onrelease")
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.x = self.y = 0.0
+        self.angle = 0.0
+        self.down = True
+        self.pen = "black"
+        self.fill_color = "black"
+        self.size = 1
+        self.line = [(0.0, 0.0)]
+        self.fill_slot = None
+        self.fill_path = None
+
+    def __getattr__(self, name):
+        if name in self.NOOPS:
+            return lambda *args, **kwargs: None
+        raise AttributeError(f"mock turtle has no method {name!r}")
+
+    def _flush(self):
+        if len(self.line) > 1:
+            self.screen.drawing.items.append(Item("line", np.array(self.line), self.pen, self.size))
+        self.line = [(self.x, self.y)]
+
+    def goto(self, x, y=None):
+        if y is None:
+            x, y = x
+        self.x, self.y = float(x), float(y)
+        if self.down:
+            self.line.append((self.x, self.y))
+        if self.fill_path is not None:
+            self.fill_path.append((self.x, self.y))
+
+    setpos = setposition = goto
+
+    def setx(self, x):
+        self.goto(x, self.y)
+
+    def sety(self, y):
+        self.goto(self.x, y)
+
+    def forward(self, distance):
+        a = math.radians(self.angle)
+        self.goto(self.x + distance * math.cos(a), self.y + distance * math.sin(a))
+
+    fd = forward
+
+    def back(self, distance):
+        self.forward(-distance)
+
+    bk = backward = back
+
+    def left(self, angle):
+        self.angle = (self.angle + angle) % 360
+
+    lt = left
+
+    def right(self, angle):
+        self.left(-angle)
+
+    rt = right
+
+    def setheading(self, angle):
+        self.angle = angle % 360
+
+    seth = setheading
+
+    def home(self):
+        self.goto(0, 0)
+        self.angle = 0.0
+
+    def circle(self, radius, extent=None, steps=None):
+        # Same segments as turtle.circle
+        if extent is None:
+            extent = 360
+        if steps is None:
+            steps = 1 + int(min(11 + abs(radius) / 6.0, 59.0) * abs(extent) / 360)
+        w = extent / steps
+        w2 = 0.5 * w
+        length = 2.0 * radius * math.sin(math.radians(w2))
+        if radius < 0:
+            length, w, w2 = -length, -w, -w2
+        self.left(w2)
+        for _ in range(steps):
+            self.forward(length)
+            self.left(w)
+        self.left(-w2)
+
+    def dot(self, size=None, *color):
+        size = size or max(self.size + 4, 2 * self.size)
+        c = self.screen._color(color) if color else self.pen
+        a = np.linspace(0, 2 * np.pi, 36, endpoint=False)
+        points = np.column_stack((self.x + size / 2 * np.cos(a), self.y + size / 2 * np.sin(a)))
+        self._flush()
+        self.screen.drawing.items.append(Item("fill", points, c, 0))
+
+    def penup(self):
+        self._flush()
+        self.down = False
+
+    pu = up = penup
+
+    def pendown(self):
+        if not self.down:
+            self.down = True
+            self.line = [(self.x, self.y)]
+
+    pd = down = pendown
+
+    def isdown(self):
+        return self.down
+
+    def pensize(self, width=None):
+        if width is None:
+            return self.size
+        self._flush()
+        self.size = width
+
+    width = pensize
+
+    def pencolor(self, *color):
+        if not color:
+            return self.pen
+        self._flush()
+        self.pen = self.screen._color(color)
+
+    def fillcolor(self, *color):
+        if not color:
+            return self.fill_color
+        self.fill_color = self.screen._color(color)
+
+    def color(self, *args):
+        if not args:
+            return self.pen, self.fill_color
+        if len(args) == 2 and not isinstance(args[0], (int, float)):
+            self.pencolor(args[0])
+            self.fillcolor(args[1])
+        else:
+            self.pencolor(*args)
+            self.fillcolor(*args)
+
+    def begin_fill(self):
+        # The fill sits below the outline drawn while filling, as in turtle
+        self._flush()
+        self.fill_slot = len(self.screen.drawing.items)
+        self.screen.drawing.items.append(None)
+        self.fill_path = [(self.x, self.y)]
+
+    def end_fill(self):
+        if self.fill_path is None:
+            return
+        self._flush()
+        if len(self.fill_path) > 2:
+            self.screen.drawing.items[self.fill_slot] = Item("fill", np.array(self.fill_path), self.fill_color, 0)
+        self.fill_path = self.fill_slot = None
+
+    def filling(self):
+        return self.fill_path is not None
+
+    def position(self):
+        return (self.x, self.y)
+
+    pos = position
+
+    def xcor(self):
+        return self.x
+
+    def ycor(self):
+        return self.y
+
+    def heading(self):
+        return self.angle
+
+    def getscreen(self):
+        return self.screen
+
+
+def _mock_module(drawing):
+    """A stand-in for the turtle module that draws into drawing."""
+    module = types.ModuleType("turtle")
+    screen = _Screen(drawing)
+    turtles = []
+    default = []
+
+    def Turtle(*args, **kwargs):
+        t = _Turtle(screen)
+        turtles.append(t)
+        return t
+
+    def get_default():
+        if not default:
+            default.append(Turtle())
+        return default[0]
+
+    module.Turtle = module.Pen = module.RawTurtle = Turtle
+    module.Screen = lambda: screen
+    module.getscreen = lambda: screen
+    module.done = module.mainloop = module.exitonclick = module.bye = lambda *args: None
+    module._turtles = turtles
+
+    # Module-level functions act on the default turtle or the screen, as in turtle
+    turtle_names = [n for n in dir(_Turtle) if not n.startswith("_")] + list(_Turtle.NOOPS)
+    for name in turtle_names:
+        setattr(module, name, (lambda n: lambda *a, **k: getattr(get_default(), n)(*a, **k))(name))
+    for name in ("bgcolor", "colormode", "setworldcoordinates", "tracer", "update", "title", "setup",
+                 "screensize", "window_width", "window_height", "listen", "onkey", "ontimer"):
+        setattr(module, name, getattr(screen, name))
+    return module
+
+
+def record(path):
+    """Run a turtle script headlessly; returns its Drawing."""
+    drawing = Drawing()
+    module = _mock_module(drawing)
+    saved_modules = {name: sys.modules.get(name) for name in ("turtle", "turtle_render")}
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.modules["turtle"] = module
+    sys.modules.pop("turtle_render", None)  # so it binds to the mock turtle
+    sys.argv = [path]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    try:
+        runpy.run_path(path, run_name="__main__")
+    finally:
+        for name, mod in saved_modules.items():
+            if mod is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = mod
+        sys.argv, sys.path[:] = saved_argv, saved_path
+    for t in module._turtles:
+        t._flush()
+    return drawing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render a turtle script without a display.")
+    parser.add_argument("script")
+    parser.add_argument("output", nargs="?", help=".png or .svg (default: print the image hash only)")
+    parser.add_argument("--size", default="%dx%d" % CANVAS_SIZE, help="WIDTHxHEIGHT")
+    parser.add_argument("--backend", choices=("pillow", "numpy"), help="PNG backend (default: Pillow if installed)")
+    args = parser.parse_args()
+    size = tuple(int(v) for v in args.size.lower().split("x"))
+
+    start = time.perf_counter()
+    drawing = record(args.script)
+    recorded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if args.output and args.output.endswith(".svg"):
+        with open(args.output, "w") as f:
+            f.write(drawing.to_svg(size))
+    elif args.output:
+        with open(args.output, "wb") as f:
+            f.write(drawing.to_png(size, args.backend))
+    rendered = time.perf_counter() - start
+
+    print(f"{args.script}: {drawing.segments} segments, {len(drawing.items)} items, "
+          f"recorded in {recorded * 1000:.1f}ms, rendered in {rendered * 1000:.1f}ms")
+    print(f"image hash: {drawing.image_hash(size)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Batched rendering for the turtle drawings
+#
+# Drawing with turtle one goto at a time, with animation on, redraws the
+# screen after every segment. Here the whole point sequence of a drawing
+# is computed up front with NumPy. Tracer is switched off, and the points
+# go to the canvas as whole polylines between screen updates.
+#
+#   walk(steps, turns)            a turtle-style walk (forward/left), vectorized
+#   arcs(radii, extents, turns)   the walk turtle.circle would take for each arc
+#   draw(points, ...)             one polyline, at once or animated in a frame budget
+import time
+import turtle
+
+import numpy as np
+
+
+def walk(steps, turns, start=(0.0, 0.0), heading=0.0):
+    """Points visited by a turtle that, for each i, turns left by turns[i]
+    degrees and then goes forward steps[i]. Returns an (n + 1, 2) array."""
+    steps = np.asarray(steps, dtype=float)
+    headings = np.radians(heading + np.cumsum(turns))
+    points = np.empty((len(steps) + 1, 2))
+    points[0] = start
+    points[1:, 0] = start[0] + np.cumsum(steps * np.cos(headings))
+    points[1:, 1] = start[1] + np.cumsum(steps * np.sin(headings))
+    return points
+
+
+def arcs(radii, extents, turns_after):
+    """(steps, turns) for walk(): for each k, circle(radii[k], extents[k])
+    followed by left(turns_after[k]), split into segments like turtle.circle."""
+    radii = np.asarray(radii, dtype=float)
+    extents = np.broadcast_to(np.asarray(extents, dtype=float), radii.shape)
+    turns_after = np.broadcast_to(np.asarray(turns_after, dtype=float), radii.shape)
+
+    # Same segment count and chord length as turtle.circle
+    counts = 1 + (np.minimum(11 + np.abs(radii) / 6.0, 59.0) * np.abs(extents) / 360).astype(int)
+    w = extents / counts
+    chord = 2.0 * radii * np.sin(np.radians(w / 2))
+    w = np.where(radii < 0, -w, w)
+    chord = np.where(radii < 0, -chord, chord)
+
+    # circle() turns w/2, then (forward, turn w) per segment, then turns -w/2;
+    # what is left after an arc's last segment carries into the next arc
+    turns = np.repeat(w, counts)
+    first = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    carry = np.concatenate(([0.0], (w / 2 + turns_after)[:-1]))
+    turns[first] = w / 2 + carry
+    return np.repeat(chord, counts), turns
+
+
+def _flat(points, xscale, yscale):
+    # World to canvas coordinates, as turtle does it: y points down on the canvas
+    coords = np.empty(2 * len(points))
+    coords[0::2] = points[:, 0] * xscale
+    coords[1::2] = -points[:, 1] * yscale
+    return coords.tolist()
+
+
+def draw(points, screen=None, color="black", width=1, frame_budget=None):
+    """Draw points as one polyline with the tracer off.
+
+    Without a frame budget everything is drawn in one screen update. With
+    frame_budget (seconds per frame) the line is revealed progressively,
+    sizing each frame's batch of points to fit the budget.
+    """
+    screen = screen or turtle.Screen()
+    screen.tracer(0, 0)
+    canvas = screen.getcanvas()
+    coords = _flat(np.asarray(points, dtype=float), screen.xscale, screen.yscale)
+
+    if frame_budget is None:
+        canvas.create_line(*coords, fill=color, width=width)
+        screen.update()
+        return
+
+    batch, i = 64, 0
+    while i < len(coords) - 2:
+        start = time.perf_counter()
+        # Each frame's line starts on the previous frame's last point
+        end = min(i + 2 * batch, len(coords) - 2)
+        canvas.create_line(*coords[i:end + 2], fill=color, width=width)
+        screen.update()
+        i = end
+        elapsed = time.perf_counter() - start
+        if elapsed < frame_budget / 2:
+            batch *= 2
+        elif elapsed > frame_budget and batch > 1:
+            batch //= 2
+        time.sleep(max(frame_budget - elapsed, 0))
@@ -1,7 +1,8 @@
-import pyttsx3
+from speech import SpeechService
+
+friend = SpeechService()
 
 while True:
-    friend = pyttsx3.init()
     speech = input("Say Something: ")
-    friend.say(speech)
-    friend.runAndWait()
+    # A new sentence replaces whatever is still being said
+    friend.say(speech, interrupt=True)
@@ -1,19 +1,28 @@
-
-import math
+import sys
 import turtle
- 
-win = turtle.Screen()
-win.bgcolor("white")
 
+import numpy as np
+
+from turtle_render import draw
+
+# Seconds per frame when animating (python wave.py --animate)
+FRAME_BUDGET = 1 / 60 if "--animate" in sys.argv else None
+
+
+def wave_points(n=3600):
+    # Generate wave form, every x at once
+    x = np.arange(n)
+    return np.column_stack((x, np.sin(np.radians(x))))
 
-# coordinate setting
-win.setworldcoordinates(0, -10, 3600, 10)
-t = turtle.Turtle()
 
-t.speed(0)
+if __name__ == "__main__":
+    win = turtle.Screen()
+    win.bgcolor("white")
 
-# Generate wave form
+    # coordinate setting
+    win.setworldcoordinates(0, -10, 3600, 10)
+    t = turtle.Turtle()
+    t.hideturtle()
 
-for x in range(3600):
-    y = math.sin(math.radians(x))
-    t.goto(x, y)
\ No newline at end of file
+    draw(wave_points(), win, frame_budget=FRAME_BUDGET)
+    turtle.done()